@@ -1,6 +1,431 @@
 # Autogenerated by nbdev
 
-d = { 'settings': { 'branch': 'master',
+d = { 'lines': { 'nbdev.clean': { 'nbdev.clean._add_jupyter_hooks': 165,
+                              'nbdev.clean._clean_cell': 75,
+                              'nbdev.clean._clean_cell_output': 61,
+                              'nbdev.clean._clean_cell_output_id': 57,
+                              'nbdev.clean._git_root': 183,
+                              'nbdev.clean._nbdev_clean': 122,
+                              'nbdev.clean._reconfigure': 104,
+                              'nbdev.clean._skip_or_sub': 55,
+                              'nbdev.clean.clean_jupyter': 147,
+                              'nbdev.clean.clean_nb': 86,
+                              'nbdev.clean.nbdev_clean': 132,
+                              'nbdev.clean.nbdev_install_hooks': 189,
+                              'nbdev.clean.nbdev_trust': 25,
+                              'nbdev.clean.process_write': 109},
+             'nbdev.cli': { 'nbdev.cli._cell_imports': 188,
+                            'nbdev.cli._import_profile': 196,
+                            'nbdev.cli._render_nb': 61,
+                            'nbdev.cli._update_repo_meta': 69,
+                            'nbdev.cli.chelp': 231,
+                            'nbdev.cli.extract_tgz': 56,
+                            'nbdev.cli.nbdev_filter': 34,
+                            'nbdev.cli.nbdev_import_profile': 213,
+                            'nbdev.cli.nbdev_new': 82,
+                            'nbdev.cli.nbdev_update_license': 132},
+             'nbdev.config': { 'nbdev.config.Profiler': 229,
+                               'nbdev.config.Profiler.__init__': 231,
+                               'nbdev.config.Profiler._parts': 238,
+                               'nbdev.config.Profiler.add': 240,
+                               'nbdev.config.Profiler.enabled': 236,
+                               'nbdev.config.Profiler.flush': 267,
+                               'nbdev.config.Profiler.save': 274,
+                               'nbdev.config.Profiler.span': 245,
+                               'nbdev.config.Profiler.stats': 258,
+                               'nbdev.config.Profiler.wrap': 249,
+                               'nbdev.config._Span': 224,
+                               'nbdev.config._Span.__enter__': 226,
+                               'nbdev.config._Span.__exit__': 227,
+                               'nbdev.config._Span.__init__': 225,
+                               'nbdev.config._add_parent_inits': 311,
+                               'nbdev.config._apply_defaults': 36,
+                               'nbdev.config._basic_export_nb': 343,
+                               'nbdev.config._cfg2txt': 130,
+                               'nbdev.config._fetch_from_git': 100,
+                               'nbdev.config._get_info': 84,
+                               'nbdev.config._git_repo': 28,
+                               'nbdev.config._has_py': 309,
+                               'nbdev.config._nbdev_config_file': 185,
+                               'nbdev.config._prompt_user': 116,
+                               'nbdev.config._type': 197,
+                               'nbdev.config._xdg_config_paths': 192,
+                               'nbdev.config.add_init': 320,
+                               'nbdev.config.config_key': 209,
+                               'nbdev.config.create_output': 215,
+                               'nbdev.config.get_config': 201,
+                               'nbdev.config.nbdev_create_config': 161,
+                               'nbdev.config.show_src': 221,
+                               'nbdev.config.update_version': 298,
+                               'nbdev.config.write_cells': 335,
+                               'nbdev.config.write_if_changed': 289},
+             'nbdev.doclinks': { 'nbdev.doclinks.CompactModidx': 209,
+                                 'nbdev.doclinks.CompactModidx.__init__': 211,
+                                 'nbdev.doclinks.CompactModidx.__iter__': 237,
+                                 'nbdev.doclinks.CompactModidx._row': 217,
+                                 'nbdev.doclinks.CompactModidx.entry': 243,
+                                 'nbdev.doclinks.CompactModidx.get': 248,
+                                 'nbdev.doclinks.CompactModidx.get_stripped': 257,
+                                 'nbdev.doclinks.CompactModidx.rows': 222,
+                                 'nbdev.doclinks.ExportManifest': 321,
+                                 'nbdev.doclinks.ExportManifest.__init__': 323,
+                                 'nbdev.doclinks.ExportManifest._key': 331,
+                                 'nbdev.doclinks.ExportManifest._mods_ok': 333,
+                                 'nbdev.doclinks.ExportManifest._path': 332,
+                                 'nbdev.doclinks.ExportManifest.save': 374,
+                                 'nbdev.doclinks.ExportManifest.stale': 337,
+                                 'nbdev.doclinks.ExportManifest.update': 365,
+                                 'nbdev.doclinks.NbdevLookup': 672,
+                                 'nbdev.doclinks.NbdevLookup.__getitem__': 700,
+                                 'nbdev.doclinks.NbdevLookup.__init__': 674,
+                                 'nbdev.doclinks.NbdevLookup._find': 704,
+                                 'nbdev.doclinks.NbdevLookup._link': 728,
+                                 'nbdev.doclinks.NbdevLookup._link_sym': 734,
+                                 'nbdev.doclinks.NbdevLookup.code': 719,
+                                 'nbdev.doclinks.NbdevLookup.doc': 714,
+                                 'nbdev.doclinks.NbdevLookup.link_line': 741,
+                                 'nbdev.doclinks.NbdevLookup.linkify': 743,
+                                 'nbdev.doclinks.SymbolSearch': 759,
+                                 'nbdev.doclinks.SymbolSearch.__init__': 761,
+                                 'nbdev.doclinks.SymbolSearch.fuzzy': 797,
+                                 'nbdev.doclinks.SymbolSearch.info': 818,
+                                 'nbdev.doclinks.SymbolSearch.load': 778,
+                                 'nbdev.doclinks.SymbolSearch.prefix': 788,
+                                 'nbdev.doclinks.SymbolSearch.search': 812,
+                                 'nbdev.doclinks._binop_leafs': 34,
+                                 'nbdev.doclinks._build_modidx': 167,
+                                 'nbdev.doclinks._cache_path': 131,
+                                 'nbdev.doclinks._cfg_hash': 290,
+                                 'nbdev.doclinks._check_files': 433,
+                                 'nbdev.doclinks._check_group': 412,
+                                 'nbdev.doclinks._compact_modidx': 159,
+                                 'nbdev.doclinks._compile_mods': 427,
+                                 'nbdev.doclinks._dist_key': 599,
+                                 'nbdev.doclinks._dists_key': 627,
+                                 'nbdev.doclinks._exp_groups': 385,
+                                 'nbdev.doclinks._exp_mods': 307,
+                                 'nbdev.doclinks._export_files': 444,
+                                 'nbdev.doclinks._export_group': 418,
+                                 'nbdev.doclinks._find_mod': 560,
+                                 'nbdev.doclinks._get_exps': 568,
+                                 'nbdev.doclinks._get_modidx': 101,
+                                 'nbdev.doclinks._iter_py_cells': 53,
+                                 'nbdev.doclinks._lazy_src': 535,
+                                 'nbdev.doclinks._lib_cache': 133,
+                                 'nbdev.doclinks._lib_syms': 747,
+                                 'nbdev.doclinks._lineno': 580,
+                                 'nbdev.doclinks._load_cache': 637,
+                                 'nbdev.doclinks._load_json': 123,
+                                 'nbdev.doclinks._load_libs': 655,
+                                 'nbdev.doclinks._mod_fname': 318,
+                                 'nbdev.doclinks._mod_name': 81,
+                                 'nbdev.doclinks._modidx_entry': 83,
+                                 'nbdev.doclinks._modidx_key': 111,
+                                 'nbdev.doclinks._nb_hash': 300,
+                                 'nbdev.doclinks._nb_mods': 383,
+                                 'nbdev.doclinks._nbdev_libs': 601,
+                                 'nbdev.doclinks._nbpath2html': 78,
+                                 'nbdev.doclinks._qual_mod': 591,
+                                 'nbdev.doclinks._qual_sym': 583,
+                                 'nbdev.doclinks._qual_syms': 592,
+                                 'nbdev.doclinks._rel': 116,
+                                 'nbdev.doclinks._save_cache': 644,
+                                 'nbdev.doclinks._save_json': 127,
+                                 'nbdev.doclinks._stat': 118,
+                                 'nbdev.doclinks._store_modidx': 399,
+                                 'nbdev.doclinks._sym_nm': 32,
+                                 'nbdev.doclinks._watch_export': 467,
+                                 'nbdev.doclinks.nbdev_export': 490,
+                                 'nbdev.doclinks.nbdev_lookup': 829,
+                                 'nbdev.doclinks.nbglob': 264,
+                                 'nbdev.doclinks.nbglob_cli': 273,
+                                 'nbdev.doclinks.patch_name': 39,
+                                 'nbdev.doclinks.update_lazy_init': 543},
+             'nbdev.export': { 'nbdev.export.ExportModuleProc': 22,
+                               'nbdev.export.ExportModuleProc.__call__': 31,
+                               'nbdev.export.ExportModuleProc._default_exp_': 26,
+                               'nbdev.export.ExportModuleProc._export_': 28,
+                               'nbdev.export.ExportModuleProc._exporti_': 27,
+                               'nbdev.export.ExportModuleProc.begin': 25,
+                               'nbdev.export._black': 46,
+                               'nbdev.export._black_formatter': 39,
+                               'nbdev.export.black_format': 52,
+                               'nbdev.export.nb_export': 81,
+                               'nbdev.export.optional_procs': 75,
+                               'nbdev.export.scrub_magics': 65},
+             'nbdev.extract_attachments': {},
+             'nbdev.frontmatter': { 'nbdev.frontmatter.FrontmatterProc': 49,
+                                    'nbdev.frontmatter.FrontmatterProc._update': 53,
+                                    'nbdev.frontmatter.FrontmatterProc.begin': 51,
+                                    'nbdev.frontmatter.FrontmatterProc.cell': 61,
+                                    'nbdev.frontmatter.FrontmatterProc.end': 65,
+                                    'nbdev.frontmatter._dict2fm': 46,
+                                    'nbdev.frontmatter._fm2dict': 25,
+                                    'nbdev.frontmatter._insertfm': 47,
+                                    'nbdev.frontmatter._md2dict': 31},
+             'nbdev.imports': {},
+             'nbdev.maker': { 'nbdev.maker.ModuleMaker': 97,
+                              'nbdev.maker.ModuleMaker.__init__': 99,
+                              'nbdev.maker.ModuleMaker._last_future': 196,
+                              'nbdev.maker.ModuleMaker._make_exists': 248,
+                              'nbdev.maker.ModuleMaker._save': 109,
+                              'nbdev.maker.ModuleMaker.make': 221,
+                              'nbdev.maker.ModuleMaker.make_all': 139,
+                              'nbdev.maker.ModuleStore': 260,
+                              'nbdev.maker.ModuleStore.__init__': 262,
+                              'nbdev.maker.ModuleStore.stale': 272,
+                              'nbdev.maker.ModuleStore.write': 266,
+                              'nbdev.maker.NbCell.import2relative': 190,
+                              'nbdev.maker.NbCell.parsed_': 88,
+                              'nbdev.maker.ParseCache': 68,
+                              'nbdev.maker.ParseCache.__call__': 72,
+                              'nbdev.maker.ParseCache.__init__': 70,
+                              'nbdev.maker.ParseCache.clear': 82,
+                              'nbdev.maker._all_targets': 131,
+                              'nbdev.maker._basic_export_nb2': 280,
+                              'nbdev.maker._filt_dec': 132,
+                              'nbdev.maker._import2relative': 204,
+                              'nbdev.maker._retr_mdoc': 210,
+                              'nbdev.maker._set_var': 50,
+                              'nbdev.maker._targets': 136,
+                              'nbdev.maker._val_or_id': 128,
+                              'nbdev.maker._wants': 133,
+                              'nbdev.maker.decor_id': 120,
+                              'nbdev.maker.find_var': 29,
+                              'nbdev.maker.make_code_cells': 155,
+                              'nbdev.maker.read_var': 39,
+                              'nbdev.maker.relative_import': 159,
+                              'nbdev.maker.update_import': 173,
+                              'nbdev.maker.update_var': 58},
+             'nbdev.merge': { 'nbdev.merge._git_branch_merge': 81,
+                              'nbdev.merge._git_merge_file': 95,
+                              'nbdev.merge._git_rebase_head': 86,
+                              'nbdev.merge._make_conflict': 43,
+                              'nbdev.merge._make_md': 42,
+                              'nbdev.merge._merge_cells': 46,
+                              'nbdev.merge._unpatch_f': 25,
+                              'nbdev.merge.nbdev_fix': 60,
+                              'nbdev.merge.nbdev_merge': 103,
+                              'nbdev.merge.unpatch': 32},
+             'nbdev.migrate': { 'nbdev.migrate.MigrateProc': 85,
+                                'nbdev.migrate.MigrateProc.begin': 87,
+                                'nbdev.migrate._cat_slug': 20,
+                                'nbdev.migrate._co': 133,
+                                'nbdev.migrate._convert_callout': 134,
+                                'nbdev.migrate._convert_video': 141,
+                                'nbdev.migrate._file_slug': 26,
+                                'nbdev.migrate._fp_convert': 64,
+                                'nbdev.migrate._fp_fm': 44,
+                                'nbdev.migrate._fp_image': 51,
+                                'nbdev.migrate._is_jekyll_post': 62,
+                                'nbdev.migrate._re_v1': 109,
+                                'nbdev.migrate._repl_directives': 117,
+                                'nbdev.migrate._repl_v1dir': 122,
+                                'nbdev.migrate._repl_v1shortcuts': 148,
+                                'nbdev.migrate._replace_fm': 33,
+                                'nbdev.migrate._rm_quote': 58,
+                                'nbdev.migrate._subv1': 106,
+                                'nbdev.migrate._v': 140,
+                                'nbdev.migrate.fp_md_fm': 93,
+                                'nbdev.migrate.migrate_md': 162,
+                                'nbdev.migrate.migrate_nb': 154,
+                                'nbdev.migrate.nbdev_migrate': 170},
+             'nbdev.process': { 'nbdev.process.NBProcessor': 208,
+                                'nbdev.process.NBProcessor.__init__': 210,
+                                'nbdev.process.NBProcessor._compact': 239,
+                                'nbdev.process.NBProcessor._proc': 245,
+                                'nbdev.process.NBProcessor._process_cell': 221,
+                                'nbdev.process.NBProcessor._process_comment': 234,
+                                'nbdev.process.NBProcessor.process': 261,
+                                'nbdev.process.Processor': 268,
+                                'nbdev.process.Processor.__call__': 272,
+                                'nbdev.process.Processor.__init__': 270,
+                                'nbdev.process.Processor.cell': 271,
+                                'nbdev.process._Handlers': 187,
+                                'nbdev.process._Handlers.__getitem__': 198,
+                                'nbdev.process._Handlers.__init__': 189,
+                                'nbdev.process._Handlers.wants': 203,
+                                'nbdev.process._cell_val': 92,
+                                'nbdev.process._dir_pre': 111,
+                                'nbdev.process._dir_re': 114,
+                                'nbdev.process._directive': 119,
+                                'nbdev.process._is_direc': 185,
+                                'nbdev.process._load': 65,
+                                'nbdev.process._meta_val': 93,
+                                'nbdev.process._mk_procs': 182,
+                                'nbdev.process._nb_val': 95,
+                                'nbdev.process._norm_quarto': 130,
+                                'nbdev.process._partition_cell': 145,
+                                'nbdev.process._quarto_re': 116,
+                                'nbdev.process._scan_seq': 70,
+                                'nbdev.process._str_end': 40,
+                                'nbdev.process._val_end': 50,
+                                'nbdev.process.extract_directives': 152,
+                                'nbdev.process.first_code_ln': 139,
+                                'nbdev.process.instantiate': 178,
+                                'nbdev.process.nb_lang': 32,
+                                'nbdev.process.opt_set': 173,
+                                'nbdev.process.scan_nb': 100},
+             'nbdev.processors': { 'nbdev.processors.FilterDefaults': 281,
+                                   'nbdev.processors.FilterDefaults.__call__': 300,
+                                   'nbdev.processors.FilterDefaults.base_procs': 287,
+                                   'nbdev.processors.FilterDefaults.nb_proc': 296,
+                                   'nbdev.processors.FilterDefaults.procs': 292,
+                                   'nbdev.processors.FilterDefaults.xtra_procs': 283,
+                                   'nbdev.processors._add_directives': 215,
+                                   'nbdev.processors._add_links': 125,
+                                   'nbdev.processors._ast_contains': 226,
+                                   'nbdev.processors._def_names': 50,
+                                   'nbdev.processors._default_exp': 118,
+                                   'nbdev.processors._do_eval': 231,
+                                   'nbdev.processors._get_nm': 55,
+                                   'nbdev.processors._import_obj': 275,
+                                   'nbdev.processors._is_showdoc': 214,
+                                   'nbdev.processors._re_hideline': 170,
+                                   'nbdev.processors._show_docs': 62,
+                                   'nbdev.processors._want_doc': 67,
+                                   'nbdev.processors.add_fold': 143,
+                                   'nbdev.processors.add_links': 131,
+                                   'nbdev.processors.add_nb_links': 135,
+                                   'nbdev.processors.add_nb_links.begin': 137,
+                                   'nbdev.processors.add_show_docs': 72,
+                                   'nbdev.processors.add_show_docs.begin': 74,
+                                   'nbdev.processors.boxify': 98,
+                                   'nbdev.processors.cell_lang': 65,
+                                   'nbdev.processors.clean_magics': 190,
+                                   'nbdev.processors.clean_show_doc': 219,
+                                   'nbdev.processors.exec_show_docs': 247,
+                                   'nbdev.processors.exec_show_docs.__call__': 255,
+                                   'nbdev.processors.exec_show_docs.begin': 250,
+                                   'nbdev.processors.exec_show_docs.end': 264,
+                                   'nbdev.processors.fdiv': 92,
+                                   'nbdev.processors.filter_stream_': 180,
+                                   'nbdev.processors.hide_': 165,
+                                   'nbdev.processors.hide_line': 172,
+                                   'nbdev.processors.insert_warning': 43,
+                                   'nbdev.processors.insert_warning.begin': 46,
+                                   'nbdev.processors.mv_exports': 105,
+                                   'nbdev.processors.mv_exports.begin': 107,
+                                   'nbdev.processors.populate_language': 32,
+                                   'nbdev.processors.populate_language.begin': 35,
+                                   'nbdev.processors.populate_language.cell': 36,
+                                   'nbdev.processors.rm_export': 208,
+                                   'nbdev.processors.rm_header_dash': 198,
+                                   'nbdev.processors.strip_ansi': 152,
+                                   'nbdev.processors.strip_hidden_metadata': 159},
+             'nbdev.qmd': { 'nbdev.qmd._install_nbdev': 79,
+                            'nbdev.qmd.btn': 57,
+                            'nbdev.qmd.div': 31,
+                            'nbdev.qmd.img': 39,
+                            'nbdev.qmd.meta': 16,
+                            'nbdev.qmd.tbl_row': 66,
+                            'nbdev.qmd.tbl_sep': 72},
+             'nbdev.quarto': { 'nbdev.quarto.IndentDumper': 102,
+                               'nbdev.quarto.IndentDumper.increase_indent': 103,
+                               'nbdev.quarto._SidebarYmlRemoved': 224,
+                               'nbdev.quarto._SidebarYmlRemoved.__enter__': 227,
+                               'nbdev.quarto._SidebarYmlRemoved.__exit__': 233,
+                               'nbdev.quarto._SidebarYmlRemoved.__init__': 226,
+                               'nbdev.quarto._copytree': 237,
+                               'nbdev.quarto._ensure_quarto': 192,
+                               'nbdev.quarto._install_linux': 34,
+                               'nbdev.quarto._install_mac': 40,
+                               'nbdev.quarto._nbglob_docs': 76,
+                               'nbdev.quarto._pre': 67,
+                               'nbdev.quarto._pre_docs': 198,
+                               'nbdev.quarto._readme_mtime_not_older': 217,
+                               'nbdev.quarto._recursive_parser': 84,
+                               'nbdev.quarto._save_cached_readme': 244,
+                               'nbdev.quarto._sort': 68,
+                               'nbdev.quarto._sprun': 27,
+                               'nbdev.quarto.fs_watchdog': 297,
+                               'nbdev.quarto.install': 60,
+                               'nbdev.quarto.install_quarto': 45,
+                               'nbdev.quarto.nbdev_docs': 273,
+                               'nbdev.quarto.nbdev_preview': 314,
+                               'nbdev.quarto.nbdev_proc_nbs': 212,
+                               'nbdev.quarto.nbdev_readme': 256,
+                               'nbdev.quarto.nbdev_sidebar': 109,
+                               'nbdev.quarto.prepare': 286,
+                               'nbdev.quarto.refresh_quarto_yml': 178},
+             'nbdev.release': { 'nbdev.release.Release': 46,
+                                'nbdev.release.Release.__init__': 47,
+                                'nbdev.release.Release._issue_groups': 65,
+                                'nbdev.release.Release._issues': 63,
+                                'nbdev.release.Release.changelog': 69,
+                                'nbdev.release.Release.latest_notes': 96,
+                                'nbdev.release.Release.release': 87,
+                                'nbdev.release._find_config': 23,
+                                'nbdev.release._get_conda_meta': 198,
+                                'nbdev.release._issue_txt': 29,
+                                'nbdev.release._issues_txt': 36,
+                                'nbdev.release._load_json': 41,
+                                'nbdev.release._run': 172,
+                                'nbdev.release._write_yaml': 188,
+                                'nbdev.release.anaconda_upload': 254,
+                                'nbdev.release.bump_version': 335,
+                                'nbdev.release.changelog': 105,
+                                'nbdev.release.chk_conda_rel': 295,
+                                'nbdev.release.conda_output_path': 183,
+                                'nbdev.release.latest_pypi': 155,
+                                'nbdev.release.nbdev_bump_version': 344,
+                                'nbdev.release.pypi_details': 161,
+                                'nbdev.release.pypi_json': 150,
+                                'nbdev.release.release_both': 320,
+                                'nbdev.release.release_conda': 265,
+                                'nbdev.release.release_gh': 124,
+                                'nbdev.release.release_git': 115,
+                                'nbdev.release.release_pypi': 310,
+                                'nbdev.release.write_conda_meta': 240,
+                                'nbdev.release.write_requirements': 246},
+             'nbdev.serve': {'nbdev.serve._is_qpy': 23, 'nbdev.serve._proc_file': 38, 'nbdev.serve.proc_nbs': 56},
+             'nbdev.serve_drv': {},
+             'nbdev.showdoc': { 'nbdev.showdoc.BasicHtmlRenderer': 198,
+                                'nbdev.showdoc.BasicHtmlRenderer._repr_html_': 200,
+                                'nbdev.showdoc.BasicHtmlRenderer.doc': 207,
+                                'nbdev.showdoc.BasicMarkdownRenderer': 166,
+                                'nbdev.showdoc.BasicMarkdownRenderer._repr_markdown_': 168,
+                                'nbdev.showdoc.DocmentTbl': 42,
+                                'nbdev.showdoc.DocmentTbl.__eq__': 106,
+                                'nbdev.showdoc.DocmentTbl.__init__': 46,
+                                'nbdev.showdoc.DocmentTbl._columns': 59,
+                                'nbdev.showdoc.DocmentTbl._hdr_list': 82,
+                                'nbdev.showdoc.DocmentTbl._repr_markdown_': 100,
+                                'nbdev.showdoc.DocmentTbl._row': 71,
+                                'nbdev.showdoc.DocmentTbl._row_list': 76,
+                                'nbdev.showdoc.DocmentTbl.has_docment': 66,
+                                'nbdev.showdoc.DocmentTbl.has_return': 69,
+                                'nbdev.showdoc.DocmentTbl.hdr_str': 85,
+                                'nbdev.showdoc.DocmentTbl.params_str': 91,
+                                'nbdev.showdoc.DocmentTbl.return_str': 96,
+                                'nbdev.showdoc.ShowDocRenderer': 121,
+                                'nbdev.showdoc.ShowDocRenderer.__init__': 122,
+                                'nbdev.showdoc._bold': 26,
+                                'nbdev.showdoc._docstring': 112,
+                                'nbdev.showdoc._escape_markdown': 29,
+                                'nbdev.showdoc._ext_link': 164,
+                                'nbdev.showdoc._f_name': 138,
+                                'nbdev.showdoc._fmt_anno': 139,
+                                'nbdev.showdoc._fmt_sig': 151,
+                                'nbdev.showdoc._fullname': 117,
+                                'nbdev.showdoc._html_link': 196,
+                                'nbdev.showdoc._list2row': 39,
+                                'nbdev.showdoc._maybe_nm': 34,
+                                'nbdev.showdoc._non_empty_keys': 25,
+                                'nbdev.showdoc._show_param': 141,
+                                'nbdev.showdoc._wrap_sig': 157,
+                                'nbdev.showdoc.colab_link': 226,
+                                'nbdev.showdoc.doc': 216,
+                                'nbdev.showdoc.show_doc': 182,
+                                'nbdev.showdoc.showdoc_nm': 221},
+             'nbdev.sync': { 'nbdev.sync._mod_files': 35,
+                             'nbdev.sync._to_absolute': 46,
+                             'nbdev.sync._update_mod': 64,
+                             'nbdev.sync._update_nb': 52,
+                             'nbdev.sync.absolute_import': 26,
+                             'nbdev.sync.nbdev_update': 71},
+             'nbdev.test': {'nbdev.test._keep_file': 61, 'nbdev.test.nbdev_test': 71, 'nbdev.test.test_nb': 26}},
+  'settings': { 'branch': 'master',
                 'doc_baseurl': '/',
                 'doc_host': 'https://nbdev.fast.ai',
                 'git_url': 'https://github.com/fastai/nbdev',
@@ -19,14 +444,32 @@ d = { 'settings': { 'branch': 'master',
                              'nbdev.clean.nbdev_install_hooks': ('api/clean.html#nbdev_install_hooks', 'nbdev/clean.py'),
                              'nbdev.clean.nbdev_trust': ('api/clean.html#nbdev_trust', 'nbdev/clean.py'),
                              'nbdev.clean.process_write': ('api/clean.html#process_write', 'nbdev/clean.py')},
-            'nbdev.cli': { 'nbdev.cli._render_nb': ('api/cli.html#_render_nb', 'nbdev/cli.py'),
+            'nbdev.cli': { 'nbdev.cli._cell_imports': ('api/cli.html#_cell_imports', 'nbdev/cli.py'),
+                           'nbdev.cli._import_profile': ('api/cli.html#_import_profile', 'nbdev/cli.py'),
+                           'nbdev.cli._render_nb': ('api/cli.html#_render_nb', 'nbdev/cli.py'),
                            'nbdev.cli._update_repo_meta': ('api/cli.html#_update_repo_meta', 'nbdev/cli.py'),
                            'nbdev.cli.chelp': ('api/cli.html#chelp', 'nbdev/cli.py'),
                            'nbdev.cli.extract_tgz': ('api/cli.html#extract_tgz', 'nbdev/cli.py'),
                            'nbdev.cli.nbdev_filter': ('api/cli.html#nbdev_filter', 'nbdev/cli.py'),
+                           'nbdev.cli.nbdev_import_profile': ('api/cli.html#nbdev_import_profile', 'nbdev/cli.py'),
                            'nbdev.cli.nbdev_new': ('api/cli.html#nbdev_new', 'nbdev/cli.py'),
                            'nbdev.cli.nbdev_update_license': ('api/cli.html#nbdev_update_license', 'nbdev/cli.py')},
-            'nbdev.config': { 'nbdev.config._apply_defaults': ('api/config.html#_apply_defaults', 'nbdev/config.py'),
+            'nbdev.config': { 'nbdev.config.Profiler': ('api/config.html#profiler', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.__init__': ('api/config.html#profiler.__init__', 'nbdev/config.py'),
+                              'nbdev.config.Profiler._parts': ('api/config.html#profiler._parts', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.add': ('api/config.html#profiler.add', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.enabled': ('api/config.html#profiler.enabled', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.flush': ('api/config.html#profiler.flush', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.save': ('api/config.html#profiler.save', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.span': ('api/config.html#profiler.span', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.stats': ('api/config.html#profiler.stats', 'nbdev/config.py'),
+                              'nbdev.config.Profiler.wrap': ('api/config.html#profiler.wrap', 'nbdev/config.py'),
+                              'nbdev.config._Span': ('api/config.html#_span', 'nbdev/config.py'),
+                              'nbdev.config._Span.__enter__': ('api/config.html#_span.__enter__', 'nbdev/config.py'),
+                              'nbdev.config._Span.__exit__': ('api/config.html#_span.__exit__', 'nbdev/config.py'),
+                              'nbdev.config._Span.__init__': ('api/config.html#_span.__init__', 'nbdev/config.py'),
+                              'nbdev.config._add_parent_inits': ('api/config.html#_add_parent_inits', 'nbdev/config.py'),
+                              'nbdev.config._apply_defaults': ('api/config.html#_apply_defaults', 'nbdev/config.py'),
                               'nbdev.config._basic_export_nb': ('api/config.html#_basic_export_nb', 'nbdev/config.py'),
                               'nbdev.config._cfg2txt': ('api/config.html#_cfg2txt', 'nbdev/config.py'),
                               'nbdev.config._fetch_from_git': ('api/config.html#_fetch_from_git', 'nbdev/config.py'),
@@ -44,32 +487,94 @@ d = { 'settings': { 'branch': 'master',
                               'nbdev.config.nbdev_create_config': ('api/config.html#nbdev_create_config', 'nbdev/config.py'),
                               'nbdev.config.show_src': ('api/config.html#show_src', 'nbdev/config.py'),
                               'nbdev.config.update_version': ('api/config.html#update_version', 'nbdev/config.py'),
-                              'nbdev.config.write_cells': ('api/config.html#write_cells', 'nbdev/config.py')},
-            'nbdev.doclinks': { 'nbdev.doclinks.NbdevLookup': ('api/doclinks.html#nbdevlookup', 'nbdev/doclinks.py'),
+                              'nbdev.config.write_cells': ('api/config.html#write_cells', 'nbdev/config.py'),
+                              'nbdev.config.write_if_changed': ('api/config.html#write_if_changed', 'nbdev/config.py')},
+            'nbdev.doclinks': { 'nbdev.doclinks.CompactModidx': ('api/doclinks.html#compactmodidx', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.__init__': ('api/doclinks.html#compactmodidx.__init__', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.__iter__': ('api/doclinks.html#compactmodidx.__iter__', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx._row': ('api/doclinks.html#compactmodidx._row', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.entry': ('api/doclinks.html#compactmodidx.entry', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.get': ('api/doclinks.html#compactmodidx.get', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.get_stripped': ( 'api/doclinks.html#compactmodidx.get_stripped',
+                                                                               'nbdev/doclinks.py'),
+                                'nbdev.doclinks.CompactModidx.rows': ('api/doclinks.html#compactmodidx.rows', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest': ('api/doclinks.html#exportmanifest', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest.__init__': ( 'api/doclinks.html#exportmanifest.__init__',
+                                                                            'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest._key': ('api/doclinks.html#exportmanifest._key', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest._mods_ok': ( 'api/doclinks.html#exportmanifest._mods_ok',
+                                                                            'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest._path': ('api/doclinks.html#exportmanifest._path', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest.save': ('api/doclinks.html#exportmanifest.save', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest.stale': ('api/doclinks.html#exportmanifest.stale', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.ExportManifest.update': ('api/doclinks.html#exportmanifest.update', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.NbdevLookup': ('api/doclinks.html#nbdevlookup', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.__getitem__': ( 'api/doclinks.html#nbdevlookup.__getitem__',
                                                                             'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.__init__': ('api/doclinks.html#nbdevlookup.__init__', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.NbdevLookup._find': ('api/doclinks.html#nbdevlookup._find', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.NbdevLookup._link': ('api/doclinks.html#nbdevlookup._link', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup._link_sym': ('api/doclinks.html#nbdevlookup._link_sym', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.code': ('api/doclinks.html#nbdevlookup.code', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.doc': ('api/doclinks.html#nbdevlookup.doc', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.link_line': ('api/doclinks.html#nbdevlookup.link_line', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.NbdevLookup.linkify': ('api/doclinks.html#nbdevlookup.linkify', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch': ('api/doclinks.html#symbolsearch', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.__init__': ('api/doclinks.html#symbolsearch.__init__', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.fuzzy': ('api/doclinks.html#symbolsearch.fuzzy', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.info': ('api/doclinks.html#symbolsearch.info', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.load': ('api/doclinks.html#symbolsearch.load', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.prefix': ('api/doclinks.html#symbolsearch.prefix', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.SymbolSearch.search': ('api/doclinks.html#symbolsearch.search', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._binop_leafs': ('api/doclinks.html#_binop_leafs', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._build_modidx': ('api/doclinks.html#_build_modidx', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._cache_path': ('api/doclinks.html#_cache_path', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._cfg_hash': ('api/doclinks.html#_cfg_hash', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._check_files': ('api/doclinks.html#_check_files', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._check_group': ('api/doclinks.html#_check_group', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._compact_modidx': ('api/doclinks.html#_compact_modidx', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._compile_mods': ('api/doclinks.html#_compile_mods', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._dist_key': ('api/doclinks.html#_dist_key', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._dists_key': ('api/doclinks.html#_dists_key', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._exp_groups': ('api/doclinks.html#_exp_groups', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._exp_mods': ('api/doclinks.html#_exp_mods', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._export_files': ('api/doclinks.html#_export_files', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._export_group': ('api/doclinks.html#_export_group', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._find_mod': ('api/doclinks.html#_find_mod', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._get_exps': ('api/doclinks.html#_get_exps', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._get_modidx': ('api/doclinks.html#_get_modidx', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._iter_py_cells': ('api/doclinks.html#_iter_py_cells', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._lazy_src': ('api/doclinks.html#_lazy_src', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._lib_cache': ('api/doclinks.html#_lib_cache', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._lib_syms': ('api/doclinks.html#_lib_syms', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._lineno': ('api/doclinks.html#_lineno', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._load_cache': ('api/doclinks.html#_load_cache', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._load_json': ('api/doclinks.html#_load_json', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._load_libs': ('api/doclinks.html#_load_libs', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._mod_fname': ('api/doclinks.html#_mod_fname', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._mod_name': ('api/doclinks.html#_mod_name', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._modidx_entry': ('api/doclinks.html#_modidx_entry', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._modidx_key': ('api/doclinks.html#_modidx_key', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._nb_hash': ('api/doclinks.html#_nb_hash', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._nb_mods': ('api/doclinks.html#_nb_mods', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._nbdev_libs': ('api/doclinks.html#_nbdev_libs', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._nbpath2html': ('api/doclinks.html#_nbpath2html', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._qual_mod': ('api/doclinks.html#_qual_mod', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._qual_sym': ('api/doclinks.html#_qual_sym', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._qual_syms': ('api/doclinks.html#_qual_syms', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._rel': ('api/doclinks.html#_rel', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._save_cache': ('api/doclinks.html#_save_cache', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._save_json': ('api/doclinks.html#_save_json', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._stat': ('api/doclinks.html#_stat', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._store_modidx': ('api/doclinks.html#_store_modidx', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks._sym_nm': ('api/doclinks.html#_sym_nm', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks._watch_export': ('api/doclinks.html#_watch_export', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.nbdev_export': ('api/doclinks.html#nbdev_export', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.nbdev_lookup': ('api/doclinks.html#nbdev_lookup', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.nbglob': ('api/doclinks.html#nbglob', 'nbdev/doclinks.py'),
                                 'nbdev.doclinks.nbglob_cli': ('api/doclinks.html#nbglob_cli', 'nbdev/doclinks.py'),
-                                'nbdev.doclinks.patch_name': ('api/doclinks.html#patch_name', 'nbdev/doclinks.py')},
+                                'nbdev.doclinks.patch_name': ('api/doclinks.html#patch_name', 'nbdev/doclinks.py'),
+                                'nbdev.doclinks.update_lazy_init': ('api/doclinks.html#update_lazy_init', 'nbdev/doclinks.py')},
             'nbdev.export': { 'nbdev.export.ExportModuleProc': ('api/export.html#exportmoduleproc', 'nbdev/export.py'),
                               'nbdev.export.ExportModuleProc.__call__': ('api/export.html#exportmoduleproc.__call__', 'nbdev/export.py'),
                               'nbdev.export.ExportModuleProc._default_exp_': ( 'api/export.html#exportmoduleproc._default_exp_',
@@ -77,6 +582,8 @@ d = { 'settings': { 'branch': 'master',
                               'nbdev.export.ExportModuleProc._export_': ('api/export.html#exportmoduleproc._export_', 'nbdev/export.py'),
                               'nbdev.export.ExportModuleProc._exporti_': ('api/export.html#exportmoduleproc._exporti_', 'nbdev/export.py'),
                               'nbdev.export.ExportModuleProc.begin': ('api/export.html#exportmoduleproc.begin', 'nbdev/export.py'),
+                              'nbdev.export._black': ('api/export.html#_black', 'nbdev/export.py'),
+                              'nbdev.export._black_formatter': ('api/export.html#_black_formatter', 'nbdev/export.py'),
                               'nbdev.export.black_format': ('api/export.html#black_format', 'nbdev/export.py'),
                               'nbdev.export.nb_export': ('api/export.html#nb_export', 'nbdev/export.py'),
                               'nbdev.export.optional_procs': ('api/export.html#optional_procs', 'nbdev/export.py'),
@@ -100,16 +607,25 @@ d = { 'settings': { 'branch': 'master',
                              'nbdev.maker.ModuleMaker.__init__': ('api/maker.html#modulemaker.__init__', 'nbdev/maker.py'),
                              'nbdev.maker.ModuleMaker._last_future': ('api/maker.html#modulemaker._last_future', 'nbdev/maker.py'),
                              'nbdev.maker.ModuleMaker._make_exists': ('api/maker.html#modulemaker._make_exists', 'nbdev/maker.py'),
-                             'nbdev.maker.ModuleMaker._update_all': ('api/maker.html#modulemaker._update_all', 'nbdev/maker.py'),
+                             'nbdev.maker.ModuleMaker._save': ('api/maker.html#modulemaker._save', 'nbdev/maker.py'),
                              'nbdev.maker.ModuleMaker.make': ('api/maker.html#modulemaker.make', 'nbdev/maker.py'),
                              'nbdev.maker.ModuleMaker.make_all': ('api/maker.html#modulemaker.make_all', 'nbdev/maker.py'),
+                             'nbdev.maker.ModuleStore': ('api/maker.html#modulestore', 'nbdev/maker.py'),
+                             'nbdev.maker.ModuleStore.__init__': ('api/maker.html#modulestore.__init__', 'nbdev/maker.py'),
+                             'nbdev.maker.ModuleStore.stale': ('api/maker.html#modulestore.stale', 'nbdev/maker.py'),
+                             'nbdev.maker.ModuleStore.write': ('api/maker.html#modulestore.write', 'nbdev/maker.py'),
                              'nbdev.maker.NbCell.import2relative': ('api/maker.html#nbcell.import2relative', 'nbdev/maker.py'),
+                             'nbdev.maker.NbCell.parsed_': ('api/maker.html#nbcell.parsed_', 'nbdev/maker.py'),
+                             'nbdev.maker.ParseCache': ('api/maker.html#parsecache', 'nbdev/maker.py'),
+                             'nbdev.maker.ParseCache.__call__': ('api/maker.html#parsecache.__call__', 'nbdev/maker.py'),
+                             'nbdev.maker.ParseCache.__init__': ('api/maker.html#parsecache.__init__', 'nbdev/maker.py'),
+                             'nbdev.maker.ParseCache.clear': ('api/maker.html#parsecache.clear', 'nbdev/maker.py'),
                              'nbdev.maker._all_targets': ('api/maker.html#_all_targets', 'nbdev/maker.py'),
                              'nbdev.maker._basic_export_nb2': ('api/maker.html#_basic_export_nb2', 'nbdev/maker.py'),
                              'nbdev.maker._filt_dec': ('api/maker.html#_filt_dec', 'nbdev/maker.py'),
                              'nbdev.maker._import2relative': ('api/maker.html#_import2relative', 'nbdev/maker.py'),
-                             'nbdev.maker._mark_text_ranges': ('api/maker.html#_mark_text_ranges', 'nbdev/maker.py'),
                              'nbdev.maker._retr_mdoc': ('api/maker.html#_retr_mdoc', 'nbdev/maker.py'),
+                             'nbdev.maker._set_var': ('api/maker.html#_set_var', 'nbdev/maker.py'),
                              'nbdev.maker._targets': ('api/maker.html#_targets', 'nbdev/maker.py'),
                              'nbdev.maker._val_or_id': ('api/maker.html#_val_or_id', 'nbdev/maker.py'),
                              'nbdev.maker._wants': ('api/maker.html#_wants', 'nbdev/maker.py'),
@@ -155,6 +671,7 @@ d = { 'settings': { 'branch': 'master',
                                'nbdev.migrate.nbdev_migrate': ('api/migrate.html#nbdev_migrate', 'nbdev/migrate.py')},
             'nbdev.process': { 'nbdev.process.NBProcessor': ('api/process.html#nbprocessor', 'nbdev/process.py'),
                                'nbdev.process.NBProcessor.__init__': ('api/process.html#nbprocessor.__init__', 'nbdev/process.py'),
+                               'nbdev.process.NBProcessor._compact': ('api/process.html#nbprocessor._compact', 'nbdev/process.py'),
                                'nbdev.process.NBProcessor._proc': ('api/process.html#nbprocessor._proc', 'nbdev/process.py'),
                                'nbdev.process.NBProcessor._process_cell': ( 'api/process.html#nbprocessor._process_cell',
                                                                             'nbdev/process.py'),
@@ -165,18 +682,31 @@ d = { 'settings': { 'branch': 'master',
                                'nbdev.process.Processor.__call__': ('api/process.html#processor.__call__', 'nbdev/process.py'),
                                'nbdev.process.Processor.__init__': ('api/process.html#processor.__init__', 'nbdev/process.py'),
                                'nbdev.process.Processor.cell': ('api/process.html#processor.cell', 'nbdev/process.py'),
+                               'nbdev.process._Handlers': ('api/process.html#_handlers', 'nbdev/process.py'),
+                               'nbdev.process._Handlers.__getitem__': ('api/process.html#_handlers.__getitem__', 'nbdev/process.py'),
+                               'nbdev.process._Handlers.__init__': ('api/process.html#_handlers.__init__', 'nbdev/process.py'),
+                               'nbdev.process._Handlers.wants': ('api/process.html#_handlers.wants', 'nbdev/process.py'),
+                               'nbdev.process._cell_val': ('api/process.html#_cell_val', 'nbdev/process.py'),
                                'nbdev.process._dir_pre': ('api/process.html#_dir_pre', 'nbdev/process.py'),
+                               'nbdev.process._dir_re': ('api/process.html#_dir_re', 'nbdev/process.py'),
                                'nbdev.process._directive': ('api/process.html#_directive', 'nbdev/process.py'),
                                'nbdev.process._is_direc': ('api/process.html#_is_direc', 'nbdev/process.py'),
+                               'nbdev.process._load': ('api/process.html#_load', 'nbdev/process.py'),
+                               'nbdev.process._meta_val': ('api/process.html#_meta_val', 'nbdev/process.py'),
                                'nbdev.process._mk_procs': ('api/process.html#_mk_procs', 'nbdev/process.py'),
+                               'nbdev.process._nb_val': ('api/process.html#_nb_val', 'nbdev/process.py'),
                                'nbdev.process._norm_quarto': ('api/process.html#_norm_quarto', 'nbdev/process.py'),
                                'nbdev.process._partition_cell': ('api/process.html#_partition_cell', 'nbdev/process.py'),
                                'nbdev.process._quarto_re': ('api/process.html#_quarto_re', 'nbdev/process.py'),
+                               'nbdev.process._scan_seq': ('api/process.html#_scan_seq', 'nbdev/process.py'),
+                               'nbdev.process._str_end': ('api/process.html#_str_end', 'nbdev/process.py'),
+                               'nbdev.process._val_end': ('api/process.html#_val_end', 'nbdev/process.py'),
                                'nbdev.process.extract_directives': ('api/process.html#extract_directives', 'nbdev/process.py'),
                                'nbdev.process.first_code_ln': ('api/process.html#first_code_ln', 'nbdev/process.py'),
                                'nbdev.process.instantiate': ('api/process.html#instantiate', 'nbdev/process.py'),
                                'nbdev.process.nb_lang': ('api/process.html#nb_lang', 'nbdev/process.py'),
-                               'nbdev.process.opt_set': ('api/process.html#opt_set', 'nbdev/process.py')},
+                               'nbdev.process.opt_set': ('api/process.html#opt_set', 'nbdev/process.py'),
+                               'nbdev.process.scan_nb': ('api/process.html#scan_nb', 'nbdev/process.py')},
             'nbdev.processors': { 'nbdev.processors.FilterDefaults': ('api/processors.html#filterdefaults', 'nbdev/processors.py'),
                                   'nbdev.processors.FilterDefaults.__call__': ( 'api/processors.html#filterdefaults.__call__',
                                                                                 'nbdev/processors.py'),
@@ -189,6 +719,7 @@ d = { 'settings': { 'branch': 'master',
                                   'nbdev.processors.FilterDefaults.xtra_procs': ( 'api/processors.html#filterdefaults.xtra_procs',
                                                                                   'nbdev/processors.py'),
                                   'nbdev.processors._add_directives': ('api/processors.html#_add_directives', 'nbdev/processors.py'),
+                                  'nbdev.processors._add_links': ('api/processors.html#_add_links', 'nbdev/processors.py'),
                                   'nbdev.processors._ast_contains': ('api/processors.html#_ast_contains', 'nbdev/processors.py'),
                                   'nbdev.processors._def_names': ('api/processors.html#_def_names', 'nbdev/processors.py'),
                                   'nbdev.processors._default_exp': ('api/processors.html#_default_exp', 'nbdev/processors.py'),
@@ -201,6 +732,8 @@ d = { 'settings': { 'branch': 'master',
                                   'nbdev.processors._want_doc': ('api/processors.html#_want_doc', 'nbdev/processors.py'),
                                   'nbdev.processors.add_fold': ('api/processors.html#add_fold', 'nbdev/processors.py'),
                                   'nbdev.processors.add_links': ('api/processors.html#add_links', 'nbdev/processors.py'),
+                                  'nbdev.processors.add_nb_links': ('api/processors.html#add_nb_links', 'nbdev/processors.py'),
+                                  'nbdev.processors.add_nb_links.begin': ('api/processors.html#add_nb_links.begin', 'nbdev/processors.py'),
                                   'nbdev.processors.add_show_docs': ('api/processors.html#add_show_docs', 'nbdev/processors.py'),
                                   'nbdev.processors.add_show_docs.begin': ( 'api/processors.html#add_show_docs.begin',
                                                                             'nbdev/processors.py'),
@@ -24,10 +24,10 @@ from fastcore.shutil import rmtree,move
 
 from urllib.error import HTTPError
 from contextlib import redirect_stdout
-import os, tarfile, sys
+import os, tarfile, sys, subprocess, json
 
 # %% auto 0
-__all__ = ['mapping', 'nbdev_filter', 'extract_tgz', 'nbdev_new', 'nbdev_update_license', 'chelp']
+__all__ = ['mapping', 'nbdev_filter', 'extract_tgz', 'nbdev_new', 'nbdev_update_license', 'nbdev_import_profile', 'chelp']
 
 # %% ../nbs/api/13_cli.ipynb
 @call_parse
@@ -158,6 +158,74 @@ def nbdev_update_license(
     lic.write(body)
     print(f"License updated from {curr_lic} to {to}")
 
+# %% ../nbs/api/13_cli.ipynb
+# Run in a fresh interpreter with only the stdlib loaded, so the cost of each cell includes all the imports it triggers
+_profile_drv = r'''
+import sys,time,types,json,__future__
+from pathlib import Path
+mod,fn = sys.argv[1:3]
+parts = mod.split('.')
+for i in range(1, len(parts)):
+    # Stand-in parent packages, so their `__init__.py` doesn't import other modules before the cells are timed
+    pkg = sys.modules['.'.join(parts[:i])] = types.ModuleType('.'.join(parts[:i]))
+    pkg.__path__ = [str(Path(fn).parents[len(parts)-1-i])]
+m = sys.modules[mod] = types.ModuleType(mod)
+m.__file__,m.__package__ = fn,'.'.join(parts[:-1])
+futs = sum(getattr(__future__, o).compiler_flag for o in __future__.all_feature_names)
+flags,ln,res = 0,0,[]
+for i,c in enumerate(Path(fn).read_text(encoding='utf-8').split('\n# %% ')):
+    hdr,src = c.partition('\n')[::2] if i else ('', c)
+    code = compile('\n'*(ln+bool(i))+src, fn, 'exec', flags=flags, dont_inherit=True)
+    flags |= code.co_flags & futs
+    ln += c.count('\n')+1
+    print(f'nbdev-cell {i}', file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    exec(code, m.__dict__)
+    res.append((hdr, time.perf_counter()-start))
+print(json.dumps(res))
+'''
+
+def _cell_imports(lines):
+    "Top level imports in `-X importtime` output `lines`, as `(name, cumulative seconds)`"
+    ents = [o.split('|') for o in lines if o.startswith('import time:') and '[us]' not in o]
+    ents = [(int(cum), nm.rstrip()) for _,cum,nm in ents]
+    if not ents: return []
+    lvl = min(len(nm)-len(nm.lstrip()) for _,nm in ents)
+    return sorted(((nm.strip(), cum/1e6) for cum,nm in ents if len(nm)-len(nm.lstrip())==lvl), key=lambda o: -o[1])
+
+def _import_profile(fn, root):
+    "Time each cell of module file `fn` under `root` in a fresh interpreter, along with the imports it triggers"
+    mod = '.'.join(Path(fn).relative_to(root).with_suffix('').parts)
+    p = subprocess.run([sys.executable, '-X', 'importtime', '-c', _profile_drv, mod, str(fn)], capture_output=True, text=True)
+    if p.returncode:
+        warn(f"Skipping {mod}, which failed to import: {p.stderr.strip().splitlines()[-1] if p.stderr.strip() else ''}")
+        return []
+    imps = p.stderr.split('nbdev-cell ')[1:]
+    res = []
+    for (hdr,secs),o in zip(json.loads(p.stdout.splitlines()[-1]), imps):
+        nb,_,idx = hdr.rpartition(' ')
+        if not nb or not idx.isdigit(): nb,idx = hdr,None
+        res.append(AttrDict(mod=mod, nb=nb, idx=idx, secs=secs, imports=_cell_imports(o.splitlines()[1:])))
+    return res
+
+# %% ../nbs/api/13_cli.ipynb
+@call_parse
+def nbdev_import_profile(
+    path:str=None, # Path to the library (defaults to `lib_path`)
+    n:int=20, # Number of cells to show
+    n_workers:int=0, # Number of modules to profile in parallel (timings are more accurate serially)
+):
+    "Import each exported module in a fresh interpreter, and show the notebook cells which take longest to run"
+    path = Path(path or get_config().lib_path).resolve()
+    fns = globtastic(path, file_glob='*.py', skip_file_re='^_', skip_folder_re=r'^[_.]').map(Path).sorted()
+    res = L(parallel(_import_profile, fns, root=path.parent, n_workers=n_workers, progress=False)).concat()
+    res = res.sorted('secs', reverse=True)[:n]
+    for o in res:
+        cell = f"{o.nb}:{o.idx}" if o.idx else o.nb or '(module header)'
+        imps = ', '.join(f"{nm} ({s*1000:.0f}ms)" for nm,s in o.imports[:3])
+        print(f"{o.secs*1000:9.1f}ms  {o.mod:30} {cell:40} {imps}")
+    return res
+
 # %% ../nbs/api/13_cli.ipynb
 @call_parse
 def chelp():
@@ -3,8 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/01_config.ipynb.
 
 # %% auto 0
-__all__ = ['nbdev_create_config', 'get_config', 'config_key', 'create_output', 'show_src', 'update_version', 'add_init',
-           'write_cells']
+__all__ = ['profiler', 'nbdev_create_config', 'get_config', 'config_key', 'create_output', 'show_src', 'Profiler',
+           'write_if_changed', 'update_version', 'add_init', 'write_cells']
 
 # %% ../nbs/api/01_config.ipynb
 from datetime import datetime
@@ -15,7 +15,7 @@ from fastcore.script import *
 from fastcore.style import *
 from fastcore.xdg import *
 
-import ast
+import ast,contextlib,json,multiprocessing,shutil,threading,time
 from IPython.display import Markdown
 from execnb.nbio import read_nb,NbCell
 from urllib.error import HTTPError
@@ -63,6 +63,9 @@ def _apply_defaults(
     clear_all:bool_arg=False, # Remove all cell metadata and cell outputs?
     cell_number:bool_arg=True, # Add cell number to the exported file
     put_version_in_init:bool_arg=True, # Add the version to the main __init__.py in nbdev_export
+    compile_modules:bool_arg=False, # Byte-compile modules changed by nbdev_export?
+    lazy_init:bool_arg=False, # Import modules in the main __init__.py lazily, on first use?
+    compact_modidx:bool_arg=False, # Store the symbol index in a compact `_modidx.jsonl`, loaded as needed?
 ):
     "Apply default settings where missing in `cfg`."
     if getattr(cfg,'repo',None) is None:
@@ -141,7 +144,7 @@ _nbdev_cfg_head = '''# All sections below are required unless otherwise specifie
 
 '''
 _nbdev_cfg_sections = {'Python library': 'repo lib_name version min_python license black_formatting',
-                       'nbdev': 'doc_path lib_path nbs_path recursive tst_flags put_version_in_init',
+                       'nbdev': 'doc_path lib_path nbs_path recursive tst_flags put_version_in_init compile_modules lazy_init compact_modidx',
                        'Docs': 'branch custom_sidebar doc_host doc_baseurl git_url title',
                        'PyPI': 'audience author author_email copyright description keywords language status user'}
 _nbdev_cfg_tail = '''### Optional ###
@@ -217,33 +220,115 @@ def create_output(txt, mime):
 # %% ../nbs/api/01_config.ipynb
 def show_src(src, lang='python'): return Markdown(f'```{lang}\n{src}\n```')
 
+# %% ../nbs/api/01_config.ipynb
+class _Span:
+    def __init__(self, prof, name, cat, args): self.prof,self.name,self.cat,self.args = prof,name,cat,args
+    def __enter__(self): self.start = time.perf_counter_ns()
+    def __exit__(self, *exc): self.prof.add(self.name, self.start, time.perf_counter_ns()-self.start, self.cat, self.args)
+
+class Profiler:
+    "Record the wall time of named stages to `fname`, if it's set"
+    def __init__(self, fname=None):
+        self.fname,self.events = fname,[]
+        self._offset = time.time_ns()-time.perf_counter_ns()
+
+    @property
+    def enabled(self): return bool(self.fname)
+    @property
+    def _parts(self): return Path(f'{self.fname}.parts')
+
+    def add(self, name, start, dur, cat='nbdev', args=None):
+        "Record stage `name` starting at `start` and taking `dur` (in `perf_counter_ns` nanoseconds)"
+        self.events.append(dict(name=name, cat=cat, ph='X', ts=(start+self._offset)/1000, dur=dur/1000,
+                                pid=os.getpid(), tid=threading.get_ident(), args=args or {}))
+
+    def span(self, name, cat='nbdev', **args):
+        "Context manager recording the time taken by its body as stage `name`"
+        return _Span(self, name, cat, args) if self.enabled else contextlib.nullcontext()
+
+    def wrap(self, f, name, cat='nbdev'):
+        "Wrap `f` so each call is recorded as stage `name` (or just return `f` if not enabled)"
+        if not self.enabled or f is None: return f
+        def _f(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try: return f(*args, **kwargs)
+            finally: self.add(name, start, time.perf_counter_ns()-start, cat)
+        return _f
+
+    def stats(self):
+        "Total time (in ms) and number of calls of each stage"
+        res = {}
+        for e in self.events:
+            st = res.setdefault(e['name'], dict(calls=0, total_ms=0.))
+            st['calls'] += 1
+            st['total_ms'] += e['dur']/1000
+        return res
+
+    def flush(self):
+        "In a worker process, save the stages recorded so far, for `save` in the main process to merge"
+        if not self.enabled or multiprocessing.current_process().name=='MainProcess': return
+        self._parts.mkdir(exist_ok=True)
+        (self._parts/f'{os.getpid()}-{time.time_ns()}.json').write_text(json.dumps(self.events))
+        self.events = []
+
+    def save(self, fname=None):
+        "Save stages, including those flushed by worker processes, to `fname` (defaults to `self.fname`)"
+        fname = fname or self.fname
+        if not fname: return
+        if self.fname and self._parts.exists():
+            for p in sorted(self._parts.glob('*.json')): self.events += json.loads(p.read_text())
+            shutil.rmtree(self._parts)
+        Path(fname).write_text(json.dumps(dict(traceEvents=self.events, displayTimeUnit='ms', stats=self.stats())))
+
+profiler = Profiler(os.environ.get('NBDEV_PROFILE'))
+
 # %% ../nbs/api/01_config.ipynb
 _re_version = re.compile(r'^__version__\s*=.*$', re.MULTILINE)
 _init = '__init__.py'
 
+def write_if_changed(fname, text, encoding='utf-8'):
+    "Write `text` to `fname`, unless it already contains exactly `text`; returns whether it was written"
+    fname = Path(fname)
+    try:
+        if fname.read_text(encoding=encoding)==text: return False
+    except (FileNotFoundError, UnicodeDecodeError): pass
+    fname.write_text(text, encoding=encoding)
+    return True
+
 def update_version(path=None):
     "Add or update `__version__` in the main `__init__.py` of the library."
     path = Path(path or get_config().lib_path)
     fname = path/_init
-    if not fname.exists(): fname.touch()
     version = f'__version__ = "{get_config().version}"'
-    code = fname.read_text()
+    try: code = fname.read_text()
+    except FileNotFoundError: code = ''
     if _re_version.search(code) is None: code = version + "\n" + code
     else: code = _re_version.sub(version, code)
-    fname.write_text(code)
+    write_if_changed(fname, code)
 
 def _has_py(fs): return any(1 for f in fs if f.endswith('.py'))
 
-def add_init(path=None):
-    "Add `__init__.py` in all subdirs of `path` containing python files if it's not there already."
-    # we add the lowest-level `__init__.py` files first, which ensures _has_py succeeds for parent modules
+def _add_parent_inits(path, dirs):
+    "Add missing `__init__.py` to each of `dirs` and their parents, up to `path`"
+    root = path.resolve()
+    for d in dirs:
+        d = Path(d).resolve()
+        while d!=root and root in d.parents:
+            if not (d/_init).exists(): (d/_init).touch()
+            d = d.parent
+
+def add_init(path=None, dirs=None):
+    "Add `__init__.py` in all subdirs of `path` containing python files (or only in `dirs` and their parents) if it's not there already."
     path = Path(path or get_config().lib_path)
     path.mkdir(exist_ok=True)
     if not (path/_init).exists(): (path/_init).touch()
-    for r,ds,fs in os.walk(path, topdown=False):
-        r = Path(r)
-        subds = (os.listdir(r/d) for d in ds)
-        if _has_py(fs) or any(filter(_has_py, subds)) and not (r/_init).exists(): (r/_init).touch()
+    if dirs is not None: _add_parent_inits(path, dirs)
+    else:
+        # we add the lowest-level `__init__.py` files first, which ensures _has_py succeeds for parent modules
+        for r,ds,fs in os.walk(path, topdown=False):
+            r = Path(r)
+            subds = (os.listdir(r/d) for d in ds)
+            if not (r/_init).exists() and (_has_py(fs) or any(filter(_has_py, subds))): (r/_init).touch()
     if get_config().get('put_version_in_init', True): update_version(path)
 
 # %% ../nbs/api/01_config.ipynb
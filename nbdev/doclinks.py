@@ -3,25 +3,30 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/05_doclinks.ipynb.
 
 # %% auto 0
-__all__ = ['patch_name', 'nbglob', 'nbglob_cli', 'nbdev_export', 'NbdevLookup']
+__all__ = ['patch_name', 'CompactModidx', 'nbglob', 'nbglob_cli', 'ExportManifest', 'nbdev_export', 'update_lazy_init',
+           'NbdevLookup', 'SymbolSearch', 'nbdev_lookup']
 
 # %% ../nbs/api/05_doclinks.ipynb
 from .config import *
 from .maker import *
 from .export import *
+from .process import *
 from .imports import *
 
 from fastcore.script import *
 from fastcore.utils import *
 from fastcore.meta import delegates
+from execnb.nbio import *
 
-import ast,contextlib
-import pkg_resources,importlib
+import ast,bisect,hashlib,itertools,json,mmap,pickle,py_compile,time,traceback
+import importlib
 from astunparse import unparse
 
 from pprint import pformat
+from collections import defaultdict
 from urllib.parse import urljoin
 from functools import lru_cache
+from fastcore.xdg import xdg_cache_home
 
 # %% ../nbs/api/05_doclinks.ipynb
 def _sym_nm(klas, sym): return f'{unparse(klas).strip()}.{sym.name}'
@@ -45,11 +50,13 @@ def patch_name(o):
     return _sym_nm(a,o)
 
 # %% ../nbs/api/05_doclinks.ipynb
-def _iter_py_cells(p):
-    "Yield cells from an exported Python file."
+def _iter_py_cells(p, txt=None):
+    "Yield cells from an exported Python file, or from its `txt` if given, along with the line each cell's code starts on."
     p = Path(p)
-    cells = p.read_text(encoding='utf-8').split("\n# %% ")
+    if txt is None: txt = p.read_text(encoding='utf-8')
+    cells = txt.split("\n# %% ")
     has_cell_number = get_config().cell_number
+    line = cells[0].count('\n')+3
     for cell in cells[1:]:
         top,code = cell.split('\n', 1)
         try:
@@ -64,51 +71,193 @@ def _iter_py_cells(p):
                                             "The expected format is: '# %% {nb_path} {cell_idx}'.")
         nb_path = None if nb=='auto' else (p.parent/nb).resolve()  # NB paths are stored relative to .py file
         if code.endswith('\n'): code=code[:-1]
-        yield AttrDict(nb=nb, idx=idx, code=code, nb_path=nb_path, py_path=p.resolve())
+        yield AttrDict(nb=nb, idx=idx, code=code, nb_path=nb_path, py_path=p.resolve(), line=line)
+        line += cell.count('\n')+1
 
 # %% ../nbs/api/05_doclinks.ipynb
 def _nbpath2html(p): return p.with_name(re.sub(r'^\d+[a-zA-Z0-9]*_', '', p.name.lower())).with_suffix('.html')
 
 # %% ../nbs/api/05_doclinks.ipynb
-def _get_modidx(py_path, code_root, nbs_path):
-    "Get module symbol index for a Python source file"
-    cfg = get_config()
-    rel_name = py_path.resolve().relative_to(code_root).as_posix()
-    mod_name = '.'.join(rel_name.rpartition('.')[0].split('/'))  # module name created by py_path
+def _mod_name(rel_name): return '.'.join(rel_name.rpartition('.')[0].split('/'))
 
+def _modidx_entry(cells, mod_name, rel_name, nbs_path):
+    "Module symbol index and line numbers for `cells`, which are `(nb_path, ast body, first line)` tuples"
     _def_types = ast.FunctionDef,ast.AsyncFunctionDef,ast.ClassDef
-    d = {}
-    for cell in _iter_py_cells(py_path):
-        if 'auto' in cell.nb: continue
-        loc = _nbpath2html(cell.nb_path.relative_to(nbs_path))
-
-        def _stor(nm):
-            for n in L(nm): d[f'{mod_name}.{n}'] = f'{loc.as_posix()}#{n.lower()}',rel_name
-        for tree in ast.parse(cell.code).body:
-            if isinstance(tree, _def_types): _stor(patch_name(tree))
+    d,lines = {},{}
+    for nb_path,trees,line in cells:
+        loc = _nbpath2html(nb_path.relative_to(nbs_path))
+
+        def _stor(nm, lineno):
+            for n in L(nm):
+                d[f'{mod_name}.{n}'] = f'{loc.as_posix()}#{n.lower()}',rel_name
+                lines[f'{mod_name}.{n}'] = line+lineno-1
+        for tree in trees or []:
+            if isinstance(tree, _def_types): _stor(patch_name(tree), tree.lineno)
             if isinstance(tree, ast.ClassDef):
                 for t2 in tree.body:
-                    if isinstance(t2, _def_types): _stor(f'{tree.name}.{t2.name}')
-    return {mod_name: d}
+                    if isinstance(t2, _def_types): _stor(f'{tree.name}.{t2.name}', t2.lineno)
+    return dict(syms={mod_name: d}, lines={mod_name: lines})
+
+def _get_modidx(py_path, code_root, nbs_path, txt=None):
+    "Get module symbol index for a Python source file, or for its `txt` if it hasn't been written yet"
+    rel_name = py_path.resolve().relative_to(code_root).as_posix()
+    cells = ((o.nb_path, parse_cache(o.code), o.line) for o in _iter_py_cells(py_path, txt) if 'auto' not in o.nb)
+    return _modidx_entry(cells, _mod_name(rel_name), rel_name, nbs_path)
+
+# %% ../nbs/api/05_doclinks.ipynb
+_modidx_cache = 'modidx.json'
+_modidx_fmt = 2  # Increment when the format of index entries changes
+
+def _modidx_key(nbs_path):
+    "Key which invalidates cached index entries when their format, the nbdev version, or relevant settings change"
+    import nbdev
+    return f'{_modidx_fmt} {nbdev.__version__} {nbs_path} {get_config().cell_number}'
+
+def _rel(p, root): return Path(p).relative_to(root).as_posix()
+
+def _stat(p):
+    try: s = Path(p).stat()
+    except FileNotFoundError: return None
+    return [s.st_mtime_ns, s.st_size]
+
+def _load_json(p):
+    try: return json.loads(Path(p).read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError): return {}
+
+def _save_json(p, d, **kwargs):
+    Path(p).parent.mkdir(parents=True, exist_ok=True)
+    Path(p).write_text(json.dumps(d, **kwargs), encoding='utf-8')
+
+def _cache_path(name): return xdg_cache_home()/'nbdev'/name
+
+def _lib_cache(lib_path, name):
+    "Path of the cache file `name` for the library in `lib_path`, kept in nbdev's cache directory rather than the project"
+    return _cache_path(Path('libs')/hashlib.md5(str(Path(lib_path).resolve()).encode()).hexdigest()/name)
+
+# %% ../nbs/api/05_doclinks.ipynb
+_modidx_sidecar = '_modidx.jsonl'
+_modidx_shim = '''# Autogenerated by nbdev
+
+# The index is in `_modidx.jsonl`, and `d` is only loaded from it when it's first used
+import json,os
+
+sidecar = os.path.join(os.path.dirname(__file__), '_modidx.jsonl')
+
+def __getattr__(name):
+    global d
+    if name!='d': raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with open(sidecar, encoding='utf-8') as f:
+        hdr = json.loads(f.readline())
+        d = dict(settings=hdr['settings'], syms={o:{} for o in hdr['mods']}, lines={o:{} for o in hdr['mods']})
+        for row in f:
+            nm,mod,doc,py,line = json.loads(row)
+            d['syms'][mod][f'{mod}.{nm}'] = doc,py
+            d['lines'][mod][f'{mod}.{nm}'] = line
+    return d
+'''
+
+def _compact_modidx(res):
+    "`_modidx.jsonl` contents for the index `res`"
+    hdr = dict(settings=res['settings'], mods=list(res['syms']))
+    rows = sorted([remove_prefix(sym, f'{mod}.'), mod, doc, py, res['lines'][mod][sym]]
+                  for mod,d in res['syms'].items() for sym,(doc,py) in d.items())
+    return ''.join(json.dumps(o, separators=(',',':'))+'\n' for o in [hdr]+rows)
 
 # %% ../nbs/api/05_doclinks.ipynb
-def _build_modidx(dest=None, nbs_path=None, skip_exists=False):
-    "Create _modidx.py"
+def _build_modidx(dest=None, nbs_path=None, skip_exists=False, n_workers=None, known=None, check=False):
+    "Create _modidx.py (and `_modidx.jsonl`, if `compact_modidx`), using the `known` index entries of modules which were just exported (or, if `check`, return whether it's out of date)"
     if dest is None: dest = get_config().lib_path
     if not Path(dest).exists(): return
     nbs_path = Path(nbs_path or get_config().nbs_path).resolve()
     if os.environ.get('IN_TEST',0): return
     idxfile = dest/'_modidx.py'
     if skip_exists and idxfile.exists(): return
-    with contextlib.suppress(FileNotFoundError): idxfile.unlink()
-    if idxfile.exists(): res = exec_local(idxfile.read_text(encoding='utf-8'), 'd')
-    else: res = dict(syms={}, settings={}) 
-    res['settings'] = {k:v for k,v in get_config().d.items()
-                       if k in ('doc_host','doc_baseurl','lib_path','git_url','branch')}
+    res = dict(syms={}, lines={}, settings={k:v for k,v in get_config().d.items()
+                                  if k in ('doc_host','doc_baseurl','lib_path','git_url','branch')})
     code_root = dest.parent.resolve()
-    for file in globtastic(dest, file_glob="*.py", skip_file_re='^_', skip_folder_re=r"\.ipynb_checkpoints"):
-        res['syms'].update(_get_modidx((dest.parent/file).resolve(), code_root, nbs_path=nbs_path))
-    idxfile.write_text("# Autogenerated by nbdev\n\nd = "+pformat(res, width=140, indent=2, compact=True)+'\n')
+    files = globtastic(dest, file_glob="*.py", skip_file_re='^_', skip_folder_re=r"\.ipynb_checkpoints"
+                      ).map(lambda o: (dest.parent/o).resolve())
+    cache_file,key = _lib_cache(dest, _modidx_cache),_modidx_key(nbs_path)
+    old = _load_json(cache_file)
+    cache = dict(old.get('files', {})) if old.get('key')==key else {}
+    stats = {f:_stat(f) for f in files}
+    for f in files:
+        if _rel(f, code_root) in ifnone(known, {}): cache[_rel(f, code_root)] = dict(stat=stats[f], idx=known[_rel(f, code_root)])
+    # Only index modules which have changed since they were last indexed
+    todo = [f for f in files if cache.get(_rel(f, code_root), {}).get('stat')!=stats[f]]
+    if n_workers is None: n_workers = 0 if len(todo)<64 else min(num_cpus(), 8)
+    for f,idx in zip(todo, parallel(_get_modidx, todo, code_root=code_root, nbs_path=nbs_path, n_workers=n_workers, progress=False)):
+        cache[_rel(f, code_root)] = dict(stat=stats[f], idx=idx)
+    cache = {_rel(f, code_root):cache[_rel(f, code_root)] for f in files}
+    for f in files:
+        idx = cache[_rel(f, code_root)]['idx']
+        res['syms'].update({mod:{k:tuple(v) for k,v in d.items()} for mod,d in idx['syms'].items()})
+        res['lines'].update(idx['lines'])
+    # `None` means the file shouldn't exist, such as a sidecar left from when `compact_modidx` was set
+    if get_config().compact_modidx: txts = {idxfile: _modidx_shim, dest/_modidx_sidecar: _compact_modidx(res)}
+    else: txts = {idxfile: "# Autogenerated by nbdev\n\nd = "+pformat(res, width=140, indent=2, compact=True)+'\n', dest/_modidx_sidecar: None}
+    def _stale(f, txt): return f.exists() if txt is None else not f.exists() or f.read_text(encoding='utf-8')!=txt
+    stale = {f:txt for f,txt in txts.items() if _stale(f, txt)}
+    if check: return bool(stale)
+    for f,txt in stale.items():
+        if txt is None: f.unlink()
+        else: f.write_text(txt, encoding='utf-8')
+    new = dict(key=key, files=cache)
+    if new!=old: _save_json(cache_file, new)
+
+# %% ../nbs/api/05_doclinks.ipynb
+class CompactModidx:
+    "Symbols in a `_modidx.jsonl` index, found by binary search of its memory-mapped rows"
+    def __init__(self, fn):
+        with open(fn, 'rb') as f: self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        hdr = json.loads(self.mm.readline())
+        self.settings,self.start = hdr['settings'],self.mm.tell()
+        self.mods = {o:i for i,o in enumerate(hdr['mods'])}
+
+    def _row(self, i):
+        "Row starting at offset `i`, and the offset of the row after it"
+        j = self.mm.find(b'\n', i)
+        return json.loads(self.mm[i:j]),j+1
+
+    def rows(self, nm):
+        "Rows of the symbols named `nm`, without their module prefix, in any module"
+        lo,hi = self.start,len(self.mm)
+        while lo<hi:
+            mid = self.mm.rfind(b'\n', lo, (lo+hi)//2)+1 or lo
+            row,nxt = self._row(mid)
+            if row[0]<nm: lo = nxt
+            else: hi = mid
+        res = []
+        while lo<len(self.mm):
+            row,lo = self._row(lo)
+            if row[0]!=nm: break
+            res.append(row)
+        return res
+
+    def __iter__(self):
+        i = self.start
+        while i<len(self.mm):
+            row,i = self._row(i)
+            yield row
+
+    def entry(self, row):
+        "`NbdevLookup` entry for `row`, with full docs and source URLs if the index has a `doc_host`"
+        _,_,doc,py,_ = row
+        return _qual_sym((doc,py), self.settings) if 'doc_host' in self.settings else (doc,py)
+
+    def get(self, sym):
+        "Row of the fully qualified `sym`, if it's in the index"
+        parts = sym.split('.')
+        for i in range(len(parts)-1, 0, -1):
+            mod = '.'.join(parts[:i])
+            if mod not in self.mods: continue
+            row = first(self.rows('.'.join(parts[i:])), lambda o: o[1]==mod)
+            if row: return row
+
+    def get_stripped(self, nm, skip_mods=None):
+        "Row of `nm` without its module prefix, from the last module to define it (as for `NbdevLookup`'s `strip_libs`)"
+        skip_mods = setify(skip_mods)
+        return max((o for o in self.rows(nm) if o[1] not in skip_mods), key=lambda o: self.mods[o[1]], default=None)
 
 # %% ../nbs/api/05_doclinks.ipynb
 @delegates(globtastic)
@@ -134,12 +283,218 @@ def nbglob_cli(
     return nbglob(path, symlinks=symlinks, file_glob=file_glob, file_re=file_re, folder_re=folder_re,
                   skip_file_glob=skip_file_glob, skip_file_re=skip_file_re, skip_folder_re=skip_folder_re)
 
+# %% ../nbs/api/05_doclinks.ipynb
+_manifest_name = 'manifest.json'
+_manifest_keys = 'lib_name lib_path nbs_path cell_number black_formatting'.split()
+
+def _cfg_hash(procs=None):
+    "Hash of the nbdev version, settings, and processors which affect exported modules"
+    import nbdev
+    cfg = get_config()
+    d = {k:str(cfg.get(k)) for k in _manifest_keys}
+    d['procs'] = [f"{getattr(p, '__module__', '')}.{getattr(p, '__qualname__', p)}" for p in L(procs)]
+    d['version'] = nbdev.__version__
+    return hashlib.sha1(json.dumps(d, sort_keys=True).encode()).hexdigest()
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _nb_hash(nb):
+    "Hash of the language, cell types, and sources of `nb`, ignoring outputs and metadata"
+    h = hashlib.sha1(nb_lang(nb).encode())
+    for cell in nb.cells: h.update(f'\0{cell.cell_type}\0{cell.source}'.encode())
+    return h.hexdigest()
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _exp_mods(nb):
+    "Names of the modules `nb` exports to, found from its directives without processing it"
+    lang,dflt,res = nb_lang(nb),None,set()
+    for cell in nb.cells:
+        if cell.cell_type!='code': continue
+        d = extract_directives(cell, remove=False, lang=lang)
+        if d.get('default_exp'): dflt = d['default_exp'][0]
+        res.update(first(d[k]) or '#' for k in ('export','exporti','exports') if k in d)
+    return {dflt if o=='#' else o for o in res} - {None}
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _mod_fname(name, lib_path): return Path(lib_path)/(name.replace('.','/') + ".py")
+
+# %% ../nbs/api/05_doclinks.ipynb
+class ExportManifest:
+    "Record of notebooks exported to `lib_path`, used to skip those which haven't changed"
+    def __init__(self, lib_path=None, procs=None):
+        cfg = get_config()
+        self.root,self.lib_path = cfg.config_path,Path(lib_path or cfg.lib_path)
+        self.path = _lib_cache(self.lib_path, _manifest_name)
+        self.cfg_hash,self.stats,self.hashes,self.updated = _cfg_hash(procs),{},{},set()
+        d = _load_json(self.path)
+        self.nbs = d.get('nbs', {}) if d.get('cfg')==self.cfg_hash else {}
+
+    def _key(self, p): return Path(os.path.relpath(Path(p).absolute(), self.root)).as_posix()
+    def _path(self, k): return Path(os.path.normpath(self.root/k))
+    def _mods_ok(self, ent): return all(_stat(self._path(m))==s for m,s in ent['mods'].items())
+
+# %% ../nbs/api/05_doclinks.ipynb
+@patch
+def stale(self:ExportManifest, files):
+    "Notebooks in `files` which need exporting, along with any others writing to the same modules"
+    paths = {self._key(f):Path(f) for f in files}
+    mods = {k:set(ent['mods']) for k,ent in self.nbs.items()}
+    dirty = {k for k in self.nbs if not self._path(k).exists()}
+    for k,p in paths.items():
+        ent,self.stats[k] = self.nbs.get(k),_stat(p)
+        if ent and self.stats[k]==ent['stat'] and self._mods_ok(ent): continue
+        nb = scan_nb(p)
+        self.hashes[k] = _nb_hash(nb)
+        if ent and self.hashes[k]==ent['hash'] and self._mods_ok(ent):
+            ent['stat'] = self.stats[k]
+            continue
+        dirty.add(k)
+        mods[k] = mods.get(k, set()) | {self._key(_mod_fname(o, self.lib_path)) for o in _exp_mods(nb)}
+    # A module written by several notebooks is only correct if all of them are exported again, in order
+    by_mod = defaultdict(set)
+    for k,ms in mods.items():
+        for m in ms: by_mod[m].add(k)
+    todo = list(dirty)
+    while todo:
+        for o in set().union(*(by_mod[m] for m in mods.get(todo.pop(), ()))) - dirty:
+            dirty.add(o)
+            todo.append(o)
+    return L(paths.get(k) or self._path(k) for k in dirty if self._path(k).exists()).sorted('name')
+
+# %% ../nbs/api/05_doclinks.ipynb
+@patch
+def update(self:ExportManifest, nb_path, mods):
+    "Record that `nb_path` was exported to `mods`"
+    k = self._key(nb_path)
+    if k not in self.stats: self.stats[k] = _stat(nb_path)
+    if k not in self.hashes: self.hashes[k] = _nb_hash(scan_nb(nb_path))
+    self.nbs[k] = dict(stat=self.stats[k], hash=self.hashes[k], mods={self._key(m):None for m in L(mods)})
+    self.updated.add(k)
+
+@patch
+def save(self:ExportManifest):
+    "Write the manifest, recording the current state of modules written since it was loaded"
+    for k in list(self.nbs):
+        if not self._path(k).exists(): del(self.nbs[k])
+    for k in self.updated & self.nbs.keys(): self.nbs[k]['mods'] = {m:_stat(self._path(m)) for m in self.nbs[k]['mods']}
+    if not self.lib_path.exists(): return
+    _save_json(self.path, dict(cfg=self.cfg_hash, nbs=self.nbs), sort_keys=True, indent=1)
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _nb_mods(nb_path, lib_path): return {str(_mod_fname(o, lib_path)) for o in _exp_mods(scan_nb(nb_path))}
+
+def _exp_groups(files, lib_path=None, n_workers=0):
+    "Partition `files` into groups of notebooks which write to the same modules, each in export order"
+    lib_path = Path(lib_path or get_config().lib_path)
+    mods = parallel(_nb_mods, files, lib_path=lib_path, n_workers=n_workers, progress=False)
+    grp,owner = list(range(len(files))),{}
+    def _root(i):
+        while grp[i]!=i: i = grp[i]
+        return i
+    for i,ms in enumerate(mods):
+        for m in ms: grp[_root(i)] = _root(owner.setdefault(m, i))
+    res = defaultdict(list)
+    for i,f in enumerate(files): res[_root(i)].append(f)
+    return list(res.values())
+
+def _store_modidx(store, lib_path=None, nbs_path=None):
+    "Index entries of the modules in `store` which it holds all of, keyed by path relative to `lib_path`'s parent"
+    cfg = get_config()
+    code_root,nbs_path = Path(lib_path or cfg.lib_path).parent.resolve(),Path(nbs_path or cfg.nbs_path).resolve()
+    res = {}
+    for fname in store:
+        if fname in store.partial: continue
+        rel_name = _rel(Path(fname).resolve(), code_root)
+        # Modules with notebooks outside `nbs_path` are left for `_build_modidx` to report
+        try: res[rel_name] = _get_modidx(Path(fname), code_root, nbs_path, txt=store[fname][0])
+        except ValueError: pass
+    return res
+
+def _check_group(files, lib_path=None, procs=None):
+    "Export `files` in memory, returning the modules which differ from those on disk and their index entries"
+    store = ModuleStore()
+    for f in files: nb_export(f, lib_path, procs=procs, store=store)
+    return store.stale(),_store_modidx(store, lib_path)
+
+def _export_group(files, lib_path=None, procs=None):
+    "Export `files` sharing a `ModuleStore`, returning the modules written by each and their index entries"
+    store = ModuleStore()
+    res = [nb_export(f, lib_path, procs=procs, store=store) for f in files]
+    store.write()
+    profiler.flush()
+    return res,_store_modidx(store, lib_path)
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _compile_mods(fnames, n_workers=None):
+    "Byte-compile the modules `fnames`, in parallel if there are many of them"
+    if n_workers is None: n_workers = 0 if len(fnames)<64 else min(num_cpus(), 8)
+    with profiler.span('compile', 'stage'): parallel(py_compile.compile, fnames, n_workers=n_workers, progress=False)
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _check_files(files, procs=None, n_workers=0):
+    "Paths of the modules (and `_modidx.py`) which exporting `files` would change, without writing anything"
+    groups = _exp_groups(files, n_workers=n_workers) if n_workers and len(files)>1 else [files]
+    stale,known = [],{}
+    for mods,idx in parallel(_check_group, groups, procs=procs, n_workers=n_workers, progress=False):
+        stale += mods
+        known.update(idx)
+    if _build_modidx(known=known, check=True): stale.append(Path(get_config().lib_path)/'_modidx.py')
+    return stale
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _export_files(files, procs=None, n_workers=0, force=False, byte_compile=False):
+    "Export those `files` which are stale, then update `__init__.py` and `_modidx.py`, and optionally byte-compile changed modules"
+    mf = ExportManifest(procs=procs)
+    if not force: files = mf.stale(files)
+    old = {str(p):_stat(p) for p in Path(get_config().lib_path).rglob('*.py')}
+    groups = _exp_groups(files, n_workers=n_workers) if n_workers and len(files)>1 else [files]
+    written,known = {},{}
+    for fs,(mods,idx) in zip(groups, parallel(_export_group, groups, procs=procs, n_workers=n_workers, progress=False)):
+        known.update(idx)
+        for f,m in zip(fs, mods):
+            mf.update(f, m)
+            for o in m: written[str(o)] = _stat(o)!=old.get(str(o))
+    mf.save()
+    if written:
+        n = sum(written.values())
+        print(f"Exported {len(written)} modules: {n} written, {len(written)-n} unchanged.")
+    if byte_compile or get_config().compile_modules: _compile_mods([o for o,w in written.items() if w])
+    add_init(get_config().lib_path, dirs={Path(o).parent for o in written})
+    if get_config().lazy_init: update_lazy_init(get_config().lib_path)
+    with profiler.span('_build_modidx', 'stage'): _build_modidx(known=known)
+    profiler.save()
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _watch_export(path=None, procs=None, n_workers=0, byte_compile=False, debounce=0.5, **kwargs):
+    "Export notebooks in `path` each time one of them is saved, until interrupted"
+    from .quarto import fs_watchdog
+    root = Path(path or get_config().nbs_path).resolve()
+    if not root.is_dir(): root = root.parent
+    last,done = [0.],[0.]
+    def _saved(e):
+        p = Path(getattr(e, 'dest_path', '') or e.src_path)
+        if not e.is_directory and p.suffix=='.ipynb' and '.ipynb_checkpoints' not in p.parts: last[0] = time.monotonic()
+    with fs_watchdog(_saved, root):
+        print(f"Watching {root} for changes, press Ctrl-C to stop.")
+        while True:
+            time.sleep(debounce/5)
+            # Wait for saves to settle, so a burst of them is exported once
+            if last[0]<=done[0] or time.monotonic()-last[0]<debounce: continue
+            done[0] = time.monotonic()
+            # A notebook saved mid-edit may not export, which shouldn't stop the watch
+            try: _export_files(nbglob(path=path, as_path=True, **kwargs).sorted('name'), procs, n_workers, byte_compile=byte_compile)
+            except Exception: traceback.print_exc()
+
 # %% ../nbs/api/05_doclinks.ipynb
 @call_parse
 @delegates(nbglob_cli)
 def nbdev_export(
     path:str=None, # Path or filename
     procs:Param("tokens naming the export processors to use.", nargs="*", choices=optional_procs())="black_format",
+    force:bool=False, # Export all notebooks, even those which haven't changed since the last export
+    n_workers:int=0, # Number of workers to export notebooks in parallel (0 to export serially)
+    watch:bool=False, # Keep running, and export notebooks again whenever they are saved
+    byte_compile:bool=False, # Byte-compile changed modules after exporting (always done if `compile_modules` is set)
+    check:bool=False, # Only check that the modules are up to date, without writing anything, and exit with an error if not
     **kwargs):
     "Export notebooks in `path` to Python modules"
     if os.environ.get('IN_TEST',0): return
@@ -147,9 +502,55 @@ def nbdev_export(
       import nbdev.export
       procs = [getattr(nbdev.export, p) for p in L(procs)]
     files = nbglob(path=path, as_path=True, **kwargs).sorted('name')
-    for f in files: nb_export(f, procs=procs)
-    add_init(get_config().lib_path)
-    _build_modidx()
+    if check:
+        stale = _check_files(files, procs, n_workers)
+        if not stale: return print("All modules are up to date.")
+        sys.stderr.write("These modules are out of date, run `nbdev_export` to update them:\n\t"+'\n\t'.join(os.path.relpath(o) for o in stale)+'\n')
+        sys.exit(1)
+    _export_files(files, procs, n_workers, force=force, byte_compile=byte_compile)
+    if watch: _watch_export(path, procs, n_workers, byte_compile=byte_compile, **kwargs)
+
+# %% ../nbs/api/05_doclinks.ipynb
+_lazy_start,_lazy_end = '# %% auto lazy imports','# %% end auto lazy imports'
+_re_lazy = re.compile(rf'\n*{_lazy_start}\n.*?{_lazy_end}\n?', re.DOTALL)
+_lazy_tmpl = '''{start}
+from typing import TYPE_CHECKING
+_lazy_mods = {names}
+__all__ = list(_lazy_mods)
+
+if TYPE_CHECKING:
+{imps}
+
+def __getattr__(name):
+    "Import the module exporting `name` the first time it's used"
+    if name not in _lazy_mods: raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    import importlib
+    res = globals()[name] = getattr(importlib.import_module(_lazy_mods[name], __name__), name)
+    return res
+
+def __dir__(): return sorted(set(globals())|set(_lazy_mods))
+{end}
+'''
+
+def _lazy_src(mods):
+    "Source of a lazy-loading section exposing the names in `mods`, a dict from relative module name to its `__all__`"
+    # Like a chain of `import *`s, names exported by several modules come from the last of them
+    names = {n:m for m,alls in mods.items() for n in alls}
+    imps = [f"    from {m} import {', '.join(alls)}" for m,alls in mods.items() if alls]
+    return _lazy_tmpl.format(start=_lazy_start, end=_lazy_end, names=pformat(names, width=120),
+                             imps='\n'.join(imps) or '    pass')
+
+def update_lazy_init(path=None):
+    "Add or update a section in the `__init__.py` of `path` which imports each module's `__all__` on first use"
+    path = Path(path or get_config().lib_path)
+    mods = {}
+    for f in sorted(globtastic(path, file_glob='*.py', skip_file_re='^_', skip_folder_re=r'^[_.]')):
+        rel = Path(f).relative_to(path).with_suffix('')
+        mods['.'+'.'.join(rel.parts)] = read_var(Path(f).read_text(encoding='utf-8'), '__all__') or []
+    fname = path/'__init__.py'
+    code = fname.read_text(encoding='utf-8') if fname.exists() else ''
+    code = _re_lazy.sub('', code).rstrip('\n')
+    return write_if_changed(fname, (code+'\n\n' if code else '')+_lazy_src(mods))
 
 # %% ../nbs/api/05_doclinks.ipynb
 import importlib,ast
@@ -191,10 +592,80 @@ def _qual_mod(mod_d, settings): return {sym:_qual_sym(s, settings) for sym,s in
 def _qual_syms(entries):
     settings = entries['settings']
     if 'doc_host' not in settings: return entries
-    return {'syms': {mod:_qual_mod(d, settings) for mod,d in entries['syms'].items()}, 'settings':settings}
+    return {'syms': {mod:_qual_mod(d, settings) for mod,d in entries['syms'].items()}, 'settings':settings,
+            'lines': entries.get('lines', {})}
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _dist_key(name): return re.sub(r'[^A-Za-z0-9.]+', '-', name).lower()
+
+def _nbdev_libs():
+    "Qualified `_modidx` entries of each library registered with the 'nbdev' entry point, with its distribution and index file"
+    try: from importlib.metadata import distributions
+    except ImportError: # Python 3.7
+        import pkg_resources
+        eps = [(o.dist.key, o.name, o.module_name, o.resolve) for o in pkg_resources.iter_entry_points(group='nbdev')]
+    else:
+        eps = []
+        for d in distributions():
+            nbeps = [o for o in d.entry_points if o.group=='nbdev']
+            if nbeps: eps += [(_dist_key(d.metadata['Name']), o.name, o.value.partition(':')[0], o.load) for o in nbeps]
+    res = {}
+    for dist,name,mod,load in eps:
+        # A distribution can be found more than once on `sys.path`, in which case the first is the one imported
+        if name in res: continue
+        # Compact indexes are searched by `NbdevLookup` as symbols are looked up, rather than loaded here
+        sidecar = getattr(importlib.import_module(mod), 'sidecar', None)
+        if sidecar:
+            # It's missing if the library was packaged without it, in which case the index can't be used
+            if os.path.exists(sidecar): res[name] = dict(dist=dist, idx=sidecar, fname=sidecar, stat=_stat(sidecar))
+            continue
+        entries = _qual_syms(load())
+        fname = sys.modules[mod].__file__
+        res[name] = dict(dist=dist, entries=entries, fname=fname, stat=_stat(fname))
+    return res
+
+def _dists_key():
+    "Hash of the environment, `sys.path`, and the names and versions of installed distributions found on it"
+    # The cache is shared by every environment, so one with the same distributions mustn't use another's index
+    paths = [os.path.abspath(p or '.') for p in sys.path]
+    res = []
+    for p in paths:
+        try: res += sorted(o for o in os.listdir(p) if o.endswith(('.dist-info','.egg-info','.egg-link','.pth')))
+        except OSError: pass
+    return hashlib.md5('\n'.join([sys.prefix, sys.executable, *paths, *res]).encode()).hexdigest()
+
+def _load_cache(name, key):
+    "Value cached in `name` with `key`, unless any of the files it was built from have changed since"
+    try:
+        with open(_cache_path(name), 'rb') as f: cache = pickle.load(f)
+        if cache['key']==key and all(_stat(k)==v for k,v in cache['stats'].items()): return cache['val']
+    except (OSError, EOFError, KeyError, TypeError, AttributeError, pickle.UnpicklingError): pass
+
+def _save_cache(name, key, libs, val):
+    "Cache `val` in `name` with `key`, until the index of any of `libs` changes"
+    fn = _cache_path(name)
+    # Written to a temporary file first, since many docs workers may be doing this at once
+    tmp = fn.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        fn.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as f: pickle.dump(dict(key=key, stats={o['fname']:o['stat'] for o in libs.values()}, val=val), f)
+        os.replace(tmp, fn)
+    except OSError: pass
+
+def _load_libs():
+    "`_nbdev_libs`, cached on disk until the installed distributions or any of their indexes change"
+    key = _dists_key()
+    libs = _load_cache('lookup.pkl', key)
+    if libs is None:
+        libs = _nbdev_libs()
+        _save_cache('lookup.pkl', key, libs, libs)
+    return libs
 
 # %% ../nbs/api/05_doclinks.ipynb
 _re_backticks = re.compile(r'`([^`\s]+)`')
+# Fenced blocks (to the end if unclosed) and indented lines are matched whole, so they are left as is.
+# Every branch starts with a literal `\n` or backtick, which lets `re` skip straight to candidates.
+_re_linkable = re.compile(r'\n```[^\n]*(?:.*?\n```[^\n]*|.*)|\n    [^\n]*|`([^`\s]+)`', re.S)
 
 # %% ../nbs/api/05_doclinks.ipynb
 @lru_cache(None)
@@ -209,19 +680,36 @@ class NbdevLookup:
         strip_libs = L(strip_libs)
         if incl_libs is not None: incl_libs = (L(incl_libs)+strip_libs).unique()
         # Dict from lib name to _nbdev module for incl_libs (defaults to all)
-        self.entries = {o.name: _qual_syms(o.resolve()) for o in list(pkg_resources.iter_entry_points(group='nbdev'))
-                       if incl_libs is None or o.dist.key in incl_libs}
-        py_syms = merge(*L(o['syms'].values() for o in self.entries.values()).concat())
+        libs = {k:o for k,o in _load_libs().items() if incl_libs is None or o['dist'] in incl_libs}
+        self.entries = {k: o['entries'] for k,o in libs.items() if 'entries' in o}
+        # Compact indexes are searched for each symbol when it's first looked up, instead of being merged here
+        self.idxs = {k: CompactModidx(o['idx']) for k,o in libs.items() if 'idx' in o}
+        self.strip_idxs,self.skip_mods = [self.idxs[m] for m in strip_libs if m in self.idxs],skip_mods
+        py_syms,lines = {},{}
+        for o in self.entries.values():
+            for d in o['syms'].values(): py_syms.update(d)
+            # Indexes built by older versions of nbdev don't have line numbers
+            for d in o.get('lines', {}).values(): lines.update(d)
+        def _strip(d): return {remove_prefix(k,f"{mod}."):v for mod,dets in d.items() if mod not in skip_mods for k,v in dets.items()}
         for m in strip_libs:
             if m in self.entries:
                 _d = self.entries[m]
-                stripped = {remove_prefix(k,f"{mod}."):v
-                            for mod,dets in _d['syms'].items() if mod not in skip_mods
-                            for k,v in dets.items()}
-                py_syms = merge(stripped, py_syms)
-        self.syms = py_syms
-
-    def __getitem__(self, s): return self.syms.get(s, None)
+                py_syms,lines = merge(_strip(_d['syms']), py_syms),merge(_strip(_d.get('lines', {})), lines)
+        self.syms,self.lines,self._links = py_syms,lines,{}
+
+    def __getitem__(self, s):
+        res = self.syms.get(s, None)
+        return self._find(s) if res is None and self.idxs else res
+
+    def _find(self, s):
+        "Look `s` up in the compact indexes, as a qualified name and then a stripped one, adding it to `syms` and `lines`"
+        rows = itertools.chain(((o,o.get(s)) for o in self.idxs.values()),
+                               ((o,o.get_stripped(s, self.skip_mods)) for o in self.strip_idxs))
+        idx,row = first(rows, lambda o: o[1] is not None) or (None,None)
+        if row is None: return
+        res = self.syms[s] = idx.entry(row)
+        self.lines[s] = row[4]
+        return res
 
     def doc(self, sym):
         "Link to docs for `sym`"
@@ -233,23 +721,120 @@ class NbdevLookup:
         res = self[sym]
         if not isinstance(res, tuple): return None
         _,py,gh = res
-        line = _lineno(sym, py)
+        line = self.lines.get(sym)
+        if line is None: line = _lineno(sym, py)
         return f'{gh}#L{line}'
 
-    def _link_sym(self, m):
-        l = m.group(1)
+    def _link(self, l):
         s = self.doc(l)
-        if s is None: return m.group(0)
+        if s is None: return f'`{l}`'
         l = l.replace('\\', r'\\')
         return rf"[`{l}`]({s})"
 
+    def _link_sym(self, m):
+        l = m.group(1)
+        if l is None: return m.group(0)
+        res = self._links.get(l)
+        if res is None: res = self._links[l] = self._link(l)
+        return res
+
     def link_line(self, l): return _re_backticks.sub(self._link_sym, l)
 
     def linkify(self, md):
-        if md:
-            in_fence=False
-            lines = md.splitlines()
-            for i,l in enumerate(lines):
-                if l.startswith("```"): in_fence=not in_fence
-                elif not l.startswith('    ') and not in_fence: lines[i] = self.link_line(l)
-            return '\n'.join(lines)
+        if md: return _re_linkable.sub(self._link_sym, '\n'+'\n'.join(md.splitlines()))[1:]
+
+# %% ../nbs/api/05_doclinks.ipynb
+def _lib_syms(o):
+    "Qualified name, stripped name, `NbdevLookup` entry, and line of each symbol in `o`, a library from `_load_libs`"
+    if 'idx' in o:
+        idx = CompactModidx(o['idx'])
+        for row in idx: yield f'{row[1]}.{row[0]}',row[0],idx.entry(row),row[4]
+        return
+    e = o['entries']
+    for mod,d in e['syms'].items():
+        lines = nested_idx(e, 'lines', mod) or {}
+        for sym,v in d.items(): yield sym,remove_prefix(sym, f'{mod}.'),v,lines.get(sym)
+
+# %% ../nbs/api/05_doclinks.ipynb
+class SymbolSearch:
+    "Prefix and fuzzy search of the qualified and stripped names of symbols in `libs` (defaults to all installed nbdev libraries)"
+    def __init__(self, libs=None):
+        if libs is None: libs = _load_libs()
+        self.syms,keys = {},set()
+        for o in libs.values():
+            for sym,nm,entry,line in _lib_syms(o):
+                self.syms[sym] = nm,entry,line
+                keys.update([(sym.lower(),sym), (nm.lower(),sym)])
+        self.keys,self.by_name = sorted(keys),defaultdict(list)
+        for k,sym in self.keys: self.by_name[k].append(sym)
+        # Fuzzy search goes through `names` shortest first, skipping those without a bit set in `bits` for each character searched for
+        self.names = sorted(self.by_name, key=lambda o: (len(o),o))
+        bits = defaultdict(lambda: bytearray(len(self.names)//8+1))
+        for i,o in enumerate(self.names):
+            for c in set(o): bits[c][i>>3] |= 1<<(i&7)
+        self.bits = {c:int.from_bytes(b, 'little') for c,b in bits.items()}
+
+    @classmethod
+    def load(cls):
+        "`SymbolSearch` of all installed nbdev libraries, cached on disk until they change"
+        key = _dists_key()
+        res = _load_cache('search.pkl', key)
+        if res is None:
+            libs = _load_libs()
+            res = cls(libs)
+            _save_cache('search.pkl', key, libs, res)
+        return res
+
+    def prefix(self, q, n=10):
+        "Qualified names of up to `n` symbols with a name starting with `q`, ignoring case"
+        q,res = q.lower(),{}
+        i = bisect.bisect_left(self.keys, (q,))
+        while i<len(self.keys) and len(res)<n and self.keys[i][0].startswith(q):
+            res[self.keys[i][1]] = None
+            i += 1
+        return list(res)
+
+    def fuzzy(self, q, n=10):
+        "Qualified names of up to `n` symbols with the shortest names containing the characters of `q` in order, ignoring case"
+        q,res = q.lower(),{}
+        cands = (1<<len(self.names))-1
+        for c in set(q): cands &= self.bits.get(c, 0)
+        pat = re.compile('.*?'.join(map(re.escape, q)))
+        # Bit `i` of `cands` is `bits[i]`, and finding the next set bit in a string is much faster than with int operations
+        bits,i = bin(cands)[:1:-1],-1
+        while len(res)<n:
+            i = bits.find('1', i+1)
+            if i<0: break
+            nm = self.names[i]
+            if pat.search(nm): res.update(dict.fromkeys(self.by_name[nm]))
+        return list(res)[:n]
+
+    def search(self, q, n=10, fuzzy=True):
+        "Qualified names of up to `n` symbols with a name starting with `q`, followed by fuzzy matches if `fuzzy`"
+        res = dict.fromkeys(self.prefix(q, n))
+        if fuzzy and len(res)<n: res.update(dict.fromkeys(self.fuzzy(q, n)))
+        return list(res)[:n]
+
+    def info(self, sym):
+        "Docs URL, source URL, and local `file:line` of the qualified `sym`"
+        nm,entry,line = self.syms[sym]
+        doc,py,src = (*entry,None)[:3] if isinstance(entry, tuple) else (entry,None,None)
+        # Indexes built by older versions of nbdev don't have line numbers
+        if line is None and py: line = _lineno(nm, py)
+        fn = _find_mod(py) if py else None
+        return AttrDict(sym=sym, doc=doc, src=f'{src}#L{line}' if src and line else src, file=f'{fn}:{line}' if fn and line else fn)
+
+# %% ../nbs/api/05_doclinks.ipynb
+@call_parse
+def nbdev_lookup(
+    query:str, # Name of the symbol to find, or the start of it, with or without its module
+    n:int=10, # Maximum number of symbols to show
+    prefix:bool=False, # Only show symbols with a name starting with `query`, without fuzzy matches
+):
+    "Show where symbols in installed nbdev libraries matching `query` are documented and defined"
+    s = SymbolSearch.load()
+    for sym in s.search(query, n, fuzzy=not prefix):
+        o = s.info(sym)
+        print(o.sym)
+        for k in ('doc','src','file'):
+            if o[k]: print(f'  {k}: {o[k]}')
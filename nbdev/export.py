@@ -16,10 +16,12 @@ from fastcore.basics import *
 from fastcore.imports import *
 
 from collections import defaultdict
+from functools import lru_cache
 
 # %% ../nbs/api/04_export.ipynb
 class ExportModuleProc:
     "A processor which exports code to a module"
+    cell_types = {'markdown'}
     def begin(self): self.modules,self.in_all = defaultdict(L),defaultdict(L)
     def _default_exp_(self, cell, exp_to): self.default_exp = exp_to
     def _exporti_(self, cell, exp_to=None): self.modules[ifnone(exp_to, '#')].append(cell)
@@ -33,18 +35,28 @@ class ExportModuleProc:
     _exports_=_export_
 
 # %% ../nbs/api/04_export.ipynb
+@lru_cache(None)
+def _black_formatter():
+    "`black.format_str`, with a `Mode` which is only created once"
+    try: import black
+    except ImportError: raise ImportError("You must install black: `pip install black` if you wish to use black formatting with nbdev")
+    return partial(black.format_str, mode=black.Mode())
+
+@lru_cache(maxsize=4096)
+def _black(src):
+    "Format `src` with `black`, caching the result so unchanged cells aren't formatted again"
+    # `black` raises `ValueError` for code it can't parse (e.g. magics) and `AssertionError` if its own checks fail
+    try: return _black_formatter()(src).strip()
+    except (ValueError, AssertionError): return src
+
 def black_format(cell, # Cell to format
                  force=False): # Turn black formatting on regardless of settings.ini
     "Processor to format code with `black`"
     try: cfg = get_config()
     except FileNotFoundError: return
     if (not cfg.black_formatting and not force) or cell.cell_type != 'code': return
-    try: import black
-    except: raise ImportError("You must install black: `pip install black` if you wish to use black formatting with nbdev")
-    else:
-        _format_str = partial(black.format_str, mode = black.Mode())
-        try: cell.source = _format_str(cell.source).strip()
-        except: pass
+    cell.source = _black(cell.source)
+black_format.cell_types = {'code'}
 
 # %% ../nbs/api/04_export.ipynb
 # includes the newline, because calling .strip() would affect all cells.
@@ -66,20 +78,25 @@ def optional_procs():
               if p not in ["nb_export", "ExportModuleProc", "optional_procs"]])
 
 # %% ../nbs/api/04_export.ipynb
-def nb_export(nbname, lib_path=None, procs=None, debug=False, mod_maker=ModuleMaker, name=None):
+def nb_export(nbname, lib_path=None, procs=None, debug=False, mod_maker=ModuleMaker, name=None, store=None):
     "Create module(s) from notebook"
     if lib_path is None: lib_path = get_config().lib_path
-    exp = ExportModuleProc()
-    nb = NBProcessor(nbname, [exp]+L(procs), debug=debug)
-    nb.process()
-    for mod,cells in exp.modules.items():
-        if first(1 for o in cells if o.cell_type=='code'):
-            all_cells = exp.in_all[mod]
-            nm = ifnone(name, getattr(exp, 'default_exp', None) if mod=='#' else mod)
-            if not nm:
-                warn(f"Notebook '{nbname}' uses `#|export` without `#|default_exp` cell.\n"
-                     "Note nbdev2 no longer supports nbdev1 syntax. Run `nbdev_migrate` to upgrade.\n"
-                     "See https://nbdev.fast.ai/getting_started.html for more information.")
-                return
-            mm = mod_maker(dest=lib_path, name=nm, nb_path=nbname, is_new=bool(name) or mod=='#')
-            mm.make(cells, all_cells, lib_path=lib_path)
+    with profiler.span(Path(nbname).name, 'notebook'):
+        exp = ExportModuleProc()
+        with profiler.span('read', 'stage'): nb = scan_nb(nbname)
+        nb = NBProcessor(nbname, [exp]+L(procs), nb=nb, debug=debug)
+        nb.process()
+        res = L()
+        for mod,cells in exp.modules.items():
+            if first(1 for o in cells if o.cell_type=='code'):
+                all_cells = exp.in_all[mod]
+                nm = ifnone(name, getattr(exp, 'default_exp', None) if mod=='#' else mod)
+                if not nm:
+                    warn(f"Notebook '{nbname}' uses `#|export` without `#|default_exp` cell.\n"
+                         "Note nbdev2 no longer supports nbdev1 syntax. Run `nbdev_migrate` to upgrade.\n"
+                         "See https://nbdev.fast.ai/getting_started.html for more information.")
+                    return res
+                mm = mod_maker(dest=lib_path, name=nm, nb_path=nbname, is_new=bool(name) or mod=='#', store=store)
+                mm.make(cells, all_cells, lib_path=lib_path)
+                res.append(mm.fname)
+        return res
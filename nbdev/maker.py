@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 # %% auto 0
-__all__ = ['find_var', 'read_var', 'update_var', 'ModuleMaker', 'decor_id', 'make_code_cells', 'relative_import', 'update_import']
+__all__ = ['parse_cache', 'find_var', 'read_var', 'update_var', 'ParseCache', 'ModuleMaker', 'decor_id', 'make_code_cells',
+           'relative_import', 'update_import', 'ModuleStore']
 
 # %% ../nbs/api/02_maker.ipynb
 from .config import *
@@ -19,9 +20,10 @@ from execnb.nbio import *
 
 import ast,contextlib
 
-from collections import defaultdict
+from collections import defaultdict,OrderedDict
 from pprint import pformat
 from textwrap import TextWrapper
+from functools import lru_cache
 
 # %% ../nbs/api/02_maker.ipynb
 def find_var(lines, varname):
@@ -45,33 +47,75 @@ def read_var(code, varname):
     except SyntaxError: raise Exception('\n'.join(res)) from None
 
 # %% ../nbs/api/02_maker.ipynb
+def _set_var(code, varname, val):
+    "Replace the definition of `varname` in `code` with `val`"
+    lines = code.splitlines()
+    start,end = find_var(lines, varname)
+    del(lines[start:end])
+    lines.insert(start, f"{varname} = {val}")
+    return '\n'.join(lines)
+
 def update_var(varname, func, fn=None, code=None):
     "Update the definition of `varname` in file `fn`, by calling `func` with the current definition"
     if fn:
         fn = Path(fn)
         code = fn.read_text(encoding='utf-8')
-    lines = code.splitlines()
-    v = read_var(code, varname)
-    res = func(v)
-    start,end = find_var(lines, varname)
-    del(lines[start:end])
-    lines.insert(start, f"{varname} = {res}")
-    code = '\n'.join(lines)
+    code = _set_var(code, varname, func(read_var(code, varname)))
     if fn: fn.write_text(code)
     else: return code
 
+# %% ../nbs/api/02_maker.ipynb
+class ParseCache:
+    "LRU cache of `ast` bodies of parsed Python source, keyed by source"
+    def __init__(self, maxsize=8192): self.maxsize,self.d = maxsize,OrderedDict()
+
+    def __call__(self, src):
+        "Parsed body of `src`, which is only parsed if it isn't already in the cache"
+        res = self.d.get(src)
+        if res is not None:
+            self.d.move_to_end(src)
+            return res
+        res = self.d[src] = ast.parse(src).body
+        if len(self.d)>self.maxsize: self.d.popitem(last=False)
+        return res
+
+    def clear(self): self.d.clear()
+
+parse_cache = ParseCache()
+
+# %% ../nbs/api/02_maker.ipynb
+@patch
+def parsed_(self:NbCell):
+    "`ast` body of a code cell's source, or `None` if it's not valid Python"
+    if self.cell_type!='code' or self.source.strip()[:1] in ['%', '!']: return
+    try: return parse_cache(self.source)
+    # you can assign the result of ! to a variable in a notebook cell
+    # which will result in a syntax error if parsed with the ast module.
+    except SyntaxError: return
+
 # %% ../nbs/api/02_maker.ipynb
 class ModuleMaker:
     "Helper class to create exported library from notebook source cells"
-    def __init__(self, dest, name, nb_path, is_new=True, parse=True):
+    def __init__(self, dest, name, nb_path, is_new=True, parse=True, store=None):
         dest,nb_path = Path(dest),Path(nb_path)
         store_attr()
         self.fname = dest/(name.replace('.','/') + ".py")
-        if is_new: dest.mkdir(parents=True, exist_ok=True)
-        else: assert self.fname.exists(), f"{self.fname} does not exist"
+        if is_new:
+            if store is None: dest.mkdir(parents=True, exist_ok=True)
+        else: assert self.fname.exists() or self.fname in ifnone(store, {}), f"{self.fname} does not exist"
         self.dest2nb = nb_path.relpath(self.fname.parent).as_posix()
         self.hdr = f"# %% {self.dest2nb}"
 
+    def _save(self, code, alls):
+        "Write `code` with `__all__` of `alls`, or add it to `store` to write later if there is one"
+        if self.store is None:
+            self.fname.parent.mkdir(exist_ok=True, parents=True)
+            with profiler.span('write', 'stage'): return write_if_changed(self.fname, code)
+        # An existing module which isn't in `store` was partly written by other notebooks
+        if self.is_new: self.store.partial.discard(self.fname)
+        elif self.fname not in self.store: self.store.partial.add(self.fname)
+        self.store[self.fname] = code,alls
+
 # %% ../nbs/api/02_maker.ipynb
 def decor_id(d):
     "`id` attr of decorator, regardless of whether called as function or bare"
@@ -111,6 +155,7 @@ def make_all(self:ModuleMaker, cells):
 def make_code_cells(*ss): return dict2nb({'cells':L(ss).map(mk_cell)}).cells
 
 # %% ../nbs/api/02_maker.ipynb
+@lru_cache(None)
 def relative_import(name, fname, level=0):
     "Convert a module `name` to a name relative to `fname`"
     assert not level
@@ -123,36 +168,22 @@ def relative_import(name, fname, level=0):
     return res.replace(os.path.sep, ".")
 
 # %% ../nbs/api/02_maker.ipynb
-# Based on https://github.com/thonny/thonny/blob/master/thonny/ast_utils.py
-def _mark_text_ranges(
-    source: str|bytes, # Source code to add ranges to
-):
-    "Adds `end_lineno` and `end_col_offset` to each `node` recursively. Used for Python 3.7 compatibility"
-    from asttokens.asttokens import ASTTokens
-    # We need to reparse the source to get a full tree to walk
-    root = ast.parse(source)
-    ASTTokens(source, tree=root)
-    for child in ast.walk(root):
-        if hasattr(child,"last_token"):
-            child.end_lineno,child.end_col_offset = child.last_token.end
-        # Some tokens stay without end info
-        if hasattr(child,"lineno") and (not hasattrs(child, ["end_lineno","end_col_offset"])):
-            child.end_lineno, child.end_col_offset = child.lineno, child.col_offset+2
-    return root.body
+_re_from = re.compile(r'from +([\w.]*)')
 
-# %% ../nbs/api/02_maker.ipynb
 def update_import(source, tree, libname, f=relative_import):
+    "Rewrite the module of each `from ... import` in `tree` using `f`, in a single pass over `source`"
     if not tree: return
-    if sys.version_info < (3,8): tree = _mark_text_ranges(source)
-    imps = L(tree).filter(risinstance(ast.ImportFrom))
+    imps = [o for o in tree if isinstance(o, ast.ImportFrom)]
     if not imps: return
     src = source.splitlines(True)
-    for imp in imps:
+    # Right to left, so rewriting an import doesn't move the others on its line
+    for imp in sorted(imps, key=lambda o: (o.lineno,o.col_offset), reverse=True):
         nmod = f(imp.module, libname, imp.level)
         lin = imp.lineno-1
-        sec = src[lin][imp.col_offset:imp.end_col_offset]
-        newsec = re.sub(f"(from +){'.'*imp.level}{imp.module or ''}", fr"\1{nmod}", sec)
-        src[lin] = src[lin].replace(sec,newsec)
+        m = _re_from.match(src[lin], imp.col_offset)
+        if not m or m.group(1)!='.'*imp.level+(imp.module or ''): continue
+        s,e = m.span(1)
+        src[lin] = src[lin][:s]+nmod+src[lin][e:]
     return src
 
 @patch
@@ -188,41 +219,62 @@ def _retr_mdoc(cells):
 # %% ../nbs/api/02_maker.ipynb
 @patch
 def make(self:ModuleMaker, cells, all_cells=None, lib_path=None):
-    "Write module containing `cells` with `__all__` generated from `all_cells`"
+    "Write module containing `cells` with `__all__` generated from `all_cells`; returns whether the file changed (or `None` with a `store`)"
     if all_cells is None: all_cells = cells
     cells,all_cells = L(cells),L(all_cells)
     if self.parse: 
         if not lib_path: lib_path = get_config().lib_path
         mod_dir = os.path.relpath(self.fname.parent, Path(lib_path).parent)
-        _import2relative(all_cells, mod_dir)
+        with profiler.span('import2relative', 'stage'): _import2relative(all_cells, mod_dir)
     if not self.is_new: return self._make_exists(cells, all_cells)
 
-    self.fname.parent.mkdir(exist_ok=True, parents=True)
     last_future = 0
     if self.parse:
-        _all = self.make_all(all_cells)
+        with profiler.span('make_all', 'stage'): _all = self.make_all(all_cells)
         last_future = self._last_future(cells) if len(all_cells)>0 else 0
         tw = TextWrapper(width=120, initial_indent='', subsequent_indent=' '*11, break_long_words=False)
         all_str = '\n'.join(tw.wrap(str(_all)))
-    with self.fname.open('w', encoding="utf-8") as f:
-        f.write(_retr_mdoc(cells))
-        f.write(f"# AUTOGENERATED! DO NOT EDIT! File to edit: {self.dest2nb}.")
-        if last_future > 0: write_cells(cells[:last_future], self.hdr, f)
-        if self.parse: f.write(f"\n\n# %% auto 0\n__all__ = {all_str}")
-        write_cells(cells[last_future:], self.hdr, f, cell_number=get_config().cell_number)
-        f.write('\n')
+    f = io.StringIO()
+    f.write(_retr_mdoc(cells))
+    f.write(f"# AUTOGENERATED! DO NOT EDIT! File to edit: {self.dest2nb}.")
+    if last_future > 0: write_cells(cells[:last_future], self.hdr, f)
+    if self.parse: f.write(f"\n\n# %% auto 0\n__all__ = {all_str}")
+    write_cells(cells[last_future:], self.hdr, f, cell_number=get_config().cell_number)
+    f.write('\n')
+    return self._save(f.getvalue(), list(_all) if self.parse else None)
 
 # %% ../nbs/api/02_maker.ipynb
-@patch
-def _update_all(self:ModuleMaker, all_cells, alls):
-    return pformat(alls + self.make_all(all_cells), width=160)
-
 @patch
 def _make_exists(self:ModuleMaker, cells, all_cells=None):
     "`make` for `is_new=False`"
+    code,alls = self.store[self.fname] if self.fname in ifnone(self.store, {}) else (self.fname.read_text(encoding='utf-8'),None)
     if all_cells and self.parse:
-        update_var('__all__', partial(self._update_all, all_cells), fn=self.fname)
-    with self.fname.open('a', encoding="utf-8") as f: write_cells(cells, self.hdr, f)
+        if alls is None: alls = read_var(code, '__all__')
+        with profiler.span('make_all', 'stage'): exps = self.make_all(all_cells)
+        code,alls = _set_var(code, '__all__', pformat(alls + exps, width=160)),list(alls)+list(exps)
+    f = io.StringIO()
+    write_cells(cells, self.hdr, f)
+    return self._save(code+f.getvalue(), alls)
+
+# %% ../nbs/api/02_maker.ipynb
+class ModuleStore(dict):
+    "Modules being made by `ModuleMaker`s, as `(code, __all__)` tuples keyed by path, to be written together"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.partial = set()
+
+    def write(self):
+        "Write each module which has changed, returning their paths"
+        with profiler.span('write', 'stage'):
+            for fname in self: fname.parent.mkdir(exist_ok=True, parents=True)
+            return [fname for fname,(code,_) in self.items() if write_if_changed(fname, code)]
+
+    def stale(self):
+        "Paths of the modules whose file is missing or differs from their code, without writing anything"
+        def _differs(fname, code):
+            try: return fname.read_text(encoding='utf-8')!=code
+            except (FileNotFoundError, UnicodeDecodeError): return True
+        return [fname for fname,(code,_) in self.items() if _differs(fname, code)]
 
 # %% ../nbs/api/02_maker.ipynb
 def _basic_export_nb2(fname, name, dest=None):
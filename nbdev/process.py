@@ -3,7 +3,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/03_process.ipynb.
 
 # %% auto 0
-__all__ = ['langs', 'nb_lang', 'first_code_ln', 'extract_directives', 'opt_set', 'instantiate', 'NBProcessor', 'Processor']
+__all__ = ['langs', 'nb_lang', 'scan_nb', 'first_code_ln', 'extract_directives', 'opt_set', 'instantiate', 'NBProcessor',
+           'Processor']
 
 # %% ../nbs/api/03_process.ipynb
 from .config import *
@@ -14,7 +15,9 @@ from execnb.nbio import *
 from fastcore.script import *
 from fastcore.imports import *
 
+import json,mmap
 from collections import defaultdict
+from functools import lru_cache
 
 # %% ../nbs/api/03_process.ipynb
 # from https://github.com/quarto-dev/quarto-cli/blob/main/src/resources/jupyter/notebook.py
@@ -28,13 +31,94 @@ langs = defaultdict(
 # %% ../nbs/api/03_process.ipynb
 def nb_lang(nb): return nested_attr(nb, 'metadata.kernelspec.language', 'python')
 
+# %% ../nbs/api/03_process.ipynb
+_ws = re.compile(rb'[ \t\n\r]*')
+_re_struct = re.compile(rb'[^"\[\]{}]*')
+_re_scalar = re.compile(rb'[^,\]} \t\n\r]*')
+_skip = object()
+
+def _str_end(s, i):
+    "Index after the end of the JSON string whose content starts at `s[i]`"
+    while True:
+        i = s.find(b'"', i)+1
+        if not i: raise ValueError("Unterminated string")
+        j = i-2
+        while s[j]==ord('\\'): j -= 1
+        # the quote is escaped if it follows an odd number of backslashes
+        if not (i-2-j)%2: return i
+
+def _val_end(s, i):
+    "Index after the JSON value starting at `s[i]`, without decoding it"
+    c = s[i]
+    if c==ord('"'): return _str_end(s, i+1)
+    if c not in b'[{': return _re_scalar.match(s, i).end()
+    depth = 0
+    while True:
+        c = s[i]
+        if c==ord('"'): i = _str_end(s, i+1)
+        else:
+            depth += 1 if c in b'[{' else -1
+            i += 1
+            if not depth: return i
+        i = _re_struct.match(s, i).end()
+
+def _load(s, i):
+    "Decode the JSON value starting at `s[i]`, returning it and the index after it"
+    end = _val_end(s, i)
+    return json.loads(s[i:end]),end
+
+def _scan_seq(s, i, val, obj=True):
+    "Scan JSON object (or array if not `obj`) at `s[i]`, using `val(s, i, key)` to get each `(value, end)`"
+    res,close = ({},ord('}')) if obj else ([],ord(']'))
+    if s[i]!=ord('{' if obj else '['): raise ValueError(f"Expected {'object' if obj else 'array'} at {i}")
+    i = _ws.match(s, i+1).end()
+    if s[i]==close: return res,i+1
+    while True:
+        if obj:
+            k,i = _load(s, i)
+            i = _ws.match(s, i).end()
+            if s[i]!=ord(':'): raise ValueError(f"Expected ':' at {i}")
+            v,i = val(s, _ws.match(s, i+1).end(), k)
+            if v is not _skip: res[k] = v
+        else:
+            v,i = val(s, i, None)
+            res.append(v)
+        i = _ws.match(s, i).end()
+        if s[i]==close: return res,i+1
+        if s[i]!=ord(','): raise ValueError(f"Expected ',' at {i}")
+        i = _ws.match(s, i+1).end()
+
+# %% ../nbs/api/03_process.ipynb
+def _cell_val(s, i, k): return ([],_val_end(s, i)) if k in ('outputs','attachments') else _load(s, i)
+def _meta_val(s, i, k): return _load(s, i) if k=='kernelspec' else (_skip,_val_end(s, i))
+
+def _nb_val(s, i, k):
+    if k=='cells': return _scan_seq(s, i, lambda s,i,_: _scan_seq(s, i, _cell_val), obj=False)
+    if k=='metadata': return _scan_seq(s, i, _meta_val)
+    return _load(s, i)
+
+def scan_nb(path):
+    "Read notebook at `path` for exporting, without loading cell outputs or metadata other than `kernelspec`"
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as s:
+            nb,_ = _scan_seq(s, _ws.match(s).end(), _nb_val)
+    except (ValueError, IndexError): return read_nb(path)
+    res = dict2nb(nb)
+    res['path_'] = str(path)
+    return res
+
 # %% ../nbs/api/03_process.ipynb
 def _dir_pre(lang=None): return fr"\s*{langs[lang]}\s*\|"
+
+@lru_cache(maxsize=None)
+def _dir_re(lang=None): return re.compile(_dir_pre(lang))
+@lru_cache(maxsize=None)
 def _quarto_re(lang=None): return re.compile(_dir_pre(lang) + r'\s*[\w|-]+\s*:')
 
 # %% ../nbs/api/03_process.ipynb
 def _directive(s, lang='python'):
-    s = re.sub('^'+_dir_pre(lang), f"{langs[lang]}|", s)
+    m = _dir_re(lang).match(s)
+    if m: s = f"{langs[lang]}|" + s[m.end():]
     if s.strip().endswith(':'): s = s.replace(':', '') # You can append colon at the end to be Quarto compliant.  Ex: #|hide:
     if ':' in s: s = s.replace(':', ': ')
     s = (s.strip()[2:]).strip().split()
@@ -45,16 +129,17 @@ def _directive(s, lang='python'):
 # %% ../nbs/api/03_process.ipynb
 def _norm_quarto(s, lang='python'):
     "normalize quarto directives so they have a space after the colon"
-    m = _quarto_re(lang).match(s)
-    return m.group(0) + ' ' + _quarto_re(lang).sub('', s).lstrip() if m else s
+    qre = _quarto_re(lang)
+    m = qre.match(s)
+    return m.group(0) + ' ' + qre.sub('', s).lstrip() if m else s
 
 # %% ../nbs/api/03_process.ipynb
 _cell_mgc = re.compile(r"^\s*%%\w+")
 
 def first_code_ln(code_list, re_pattern=None, lang='python'):
     "get first line number where code occurs, where `code_list` is a list of code"
-    if re_pattern is None: re_pattern = _dir_pre(lang)
-    return first(i for i,o in enumerate(code_list) if o.strip() != '' and not re.match(re_pattern, o) and not _cell_mgc.match(o))
+    pat = _dir_re(lang) if re_pattern is None else re.compile(re_pattern)
+    return first(i for i,o in enumerate(code_list) if o.strip() != '' and not pat.match(o) and not _cell_mgc.match(o))
 
 # %% ../nbs/api/03_process.ipynb
 def _partition_cell(cell, lang):
@@ -66,12 +151,23 @@ def _partition_cell(cell, lang):
 # %% ../nbs/api/03_process.ipynb
 def extract_directives(cell, remove=True, lang='python'):
     "Take leading comment directives from lines of code in `ss`, remove `#|`, and split"
-    dirs,code = _partition_cell(cell, lang)
-    if not dirs: return {}
-    if remove:
+    if not cell.source: return {}
+    lines = cell.source.splitlines(True)
+    dir_re,quarto_re = _dir_re(lang),_quarto_re(lang)
+    res,keep = {},[]
+    # A single pass over the leading directives, magics, and blank lines, stopping at the first line of code
+    for i,o in enumerate(lines):
+        is_dir = dir_re.match(o)
+        is_mgc = not is_dir and _cell_mgc.match(o)
+        if not (is_dir or is_mgc or o.strip()==''): break
         # Leave Quarto directives and cell magic in place for later processing
-        cell['source'] = ''.join([_norm_quarto(o, lang) for o in dirs if _quarto_re(lang).match(o) or _cell_mgc.match(o)] + code)
-    return dict(L(_directive(s, lang) for s in dirs).filter())
+        if is_mgc or quarto_re.match(o): keep.append(_norm_quarto(o, lang))
+        d = _directive(o, lang)
+        if d: res[d[0]] = d[1]
+    else: i = None # No code, so (like `_partition_cell`) the lines are all kept
+    if i==0: return {}
+    if remove: cell['source'] = ''.join(keep + lines[i:])
+    return res
 
 # %% ../nbs/api/03_process.ipynb
 def opt_set(var, newval):
@@ -88,45 +184,85 @@ def _mk_procs(procs, nb): return L(procs).map(instantiate, nb=nb)
 # %% ../nbs/api/03_process.ipynb
 def _is_direc(f): return getattr(f, '__name__', '-')[-1]=='_'
 
+class _Handlers:
+    "Index from directive names to the methods of `proc` handling them"
+    def __init__(self, proc, cmds=()):
+        self.proc,self.d = proc,{}
+        self.name = getattr(proc, '__name__', '-').rstrip('_')
+        self.call = callable(proc) and not _is_direc(proc)
+        self.cell_types = getattr(proc, 'cell_types', None)
+        self.pname = getattr(proc, '__name__', None) or type(proc).__name__
+        self.f = profiler.wrap(proc, self.pname if _is_direc(proc) else f'{self.pname}.cell', 'processor')
+        for cmd in cmds: self[cmd]
+
+    def __getitem__(self, cmd):
+        "Method named `_{cmd}_` in `proc`, if any"
+        if cmd not in self.d: self.d[cmd] = profiler.wrap(getattr(self.proc, f'_{cmd}_', None), f'{self.pname}._{cmd}_', 'directive')
+        return self.d[cmd]
+
+    def wants(self, cell):
+        "Whether `proc` should be called on `cell`"
+        return self.call and (self.cell_types is None or cell.cell_type in self.cell_types)
+
 # %% ../nbs/api/03_process.ipynb
 class NBProcessor:
     "Process cells and nbdev comments in a notebook"
     def __init__(self, path=None, procs=None, nb=None, debug=False, rm_directives=True, process=False):
         self.nb = read_nb(path) if nb is None else nb
         self.lang = nb_lang(self.nb)
-        for cell in self.nb.cells: cell.directives_ = extract_directives(cell, remove=rm_directives, lang=self.lang)
+        with profiler.span('extract_directives', 'stage'):
+            for cell in self.nb.cells: cell.directives_ = extract_directives(cell, remove=rm_directives, lang=self.lang)
         self.procs = _mk_procs(procs, nb=self.nb)
-        self.debug,self.rm_directives = debug,rm_directives
+        cmds = {k for cell in self.nb.cells for k in cell.directives_}
+        self.handlers = self.procs.map(_Handlers, cmds=cmds)
+        self.debug,self.rm_directives,self._dirty = debug,rm_directives,True
         if process: self.process()
 
-    def _process_cell(self, proc, cell):
-        if not hasattr(cell,'source'): return
-        if cell.cell_type=='code' and cell.directives_:
+    def _process_cell(self, h, cell):
+        if cell.get('source') is None: return
+        if cell['cell_type']=='code' and cell.get('directives_'):
             # Option 1: `proc` is directive name with `_` suffix
-            f = getattr(proc, '__name__', '-').rstrip('_')
-            if f in cell.directives_: self._process_comment(proc, cell, f)
+            if h.name in cell.directives_: self._process_comment(h.f, cell, h.name)
             
             # Option 2: `proc` contains a method named `_{directive}_`
             for cmd in cell.directives_:
-                f = getattr(proc, f'_{cmd}_', None)
+                f = h[cmd]
                 if f: self._process_comment(f, cell, cmd)
-        if callable(proc) and not _is_direc(proc): cell = opt_set(cell, proc(cell))
+        if h.wants(cell): cell = opt_set(cell, h.f(cell))
+        if cell.get('source') is None: self._dirty = True
 
     def _process_comment(self, proc, cell, cmd):
         args = cell.directives_[cmd]
         if self.debug: print(cmd, args, proc)
         return proc(cell, *args)
         
-    def _proc(self, proc):
-        if hasattr(proc,'begin'): proc.begin()
-        for cell in self.nb.cells: self._process_cell(proc, cell)
-        if hasattr(proc,'end'): proc.end()
+    def _compact(self):
+        "Drop removed cells, and update `idx_` to match"
         self.nb.cells = [c for c in self.nb.cells if c and getattr(c,'source',None) is not None]
         for i,cell in enumerate(self.nb.cells): cell.idx_ = i
+        self._dirty = False
+
+    def _proc(self, h):
+        proc = h.proc
+        nb_wide = hasattr(proc,'begin') or hasattr(proc,'end')
+        # Only processors which work on the whole notebook need removed cells to be dropped first
+        if nb_wide and self._dirty: self._compact()
+        cells = self.nb.cells
+        n = len(cells)
+        if hasattr(proc,'begin'):
+            with profiler.span(f'{h.pname}.begin', 'processor'): proc.begin()
+        for cell in self.nb.cells:
+            # Processors which only handle directives can skip cells without any
+            if h.call or cell.get('directives_'): self._process_cell(h, cell)
+        if hasattr(proc,'end'):
+            with profiler.span(f'{h.pname}.end', 'processor'): proc.end()
+        if nb_wide or self.nb.cells is not cells or len(cells)!=n: self._dirty = True
 
     def process(self):
         "Process all cells with all processors"
-        for proc in self.procs: self._proc(proc)
+        with profiler.span('process', 'stage', nb=self.nb.get('path_')):
+            for h in self.handlers: self._proc(h)
+            if self._dirty: self._compact()
 
 # %% ../nbs/api/03_process.ipynb
 class Processor:
@@ -4,8 +4,8 @@
 
 # %% auto 0
 __all__ = ['populate_language', 'insert_warning', 'cell_lang', 'add_show_docs', 'fdiv', 'boxify', 'mv_exports', 'add_links',
-           'add_fold', 'strip_ansi', 'strip_hidden_metadata', 'hide_', 'hide_line', 'filter_stream_', 'clean_magics',
-           'rm_header_dash', 'rm_export', 'clean_show_doc', 'exec_show_docs', 'FilterDefaults']
+           'add_nb_links', 'add_fold', 'strip_ansi', 'strip_hidden_metadata', 'hide_', 'hide_line', 'filter_stream_',
+           'clean_magics', 'rm_header_dash', 'rm_export', 'clean_show_doc', 'exec_show_docs', 'FilterDefaults']
 
 # %% ../nbs/api/10_processors.ipynb
 import ast
@@ -31,6 +31,7 @@ _lang_pattern = re.compile(rf'^\s*%%\s*({_langs})\s*$', flags=re.MULTILINE)
 
 class populate_language(Processor):
     "Set cell language based on NB metadata and magics"
+    cell_types = {'code'}
     def begin(self): self.language = nb_lang(self.nb)
     def cell(self, cell):
         if cell.cell_type != 'code': return
@@ -75,13 +76,16 @@ class add_show_docs(Processor):
         exports = L(cell for cell in nb.cells if _want_doc(cell))
         trees = L(nb.cells).map(NbCell.parsed_).concat()
         shown_docs = {_get_nm(t) for t in _show_docs(trees)}
-        for cell in reversed(exports):
+        exp_ids,cells = set(map(id, exports)),[]
+        for cell in nb.cells:
+            cells.append(cell)
+            if id(cell) not in exp_ids: continue
             if cell_lang(cell) != 'python':  raise ValueError(f"{cell.metadata.language} can't export:\n{cell.source}")
-            nms = _def_names(cell, shown_docs)
-            for nm in nms:
+            for nm in reversed(_def_names(cell, shown_docs)):
                 new_cell = mk_cell(f'show_doc({nm})')
                 new_cell.has_sd = True
-                nb.cells.insert(cell.idx_+1, new_cell)
+                cells.append(new_cell)
+        nb.cells = cells
         nb.has_docs_ = shown_docs or exports
 
 # %% ../nbs/api/10_processors.ipynb
@@ -101,14 +105,12 @@ def boxify(cells):
 class mv_exports(Processor):
     "Move `exports` cells to after the `show_doc`"
     def begin(self):
-        cells = self.nb.cells
-        exports = L(c for c in cells if c.cell_type=='code' and 'exports' in c.directives_)
-        for cell in reversed(exports):
-            idx = cell.idx_
-            if getattr(cells[idx+1], 'has_sd', 0):
-                doccell = cells.pop(idx+1)
-                srccell = cells.pop(idx)
-                cells[idx:idx] = [doccell,srccell]
+        # `res` is built in reverse, so `res[-1]` is the cell after `c`
+        res = []
+        for c in reversed(self.nb.cells):
+            if c.cell_type=='code' and 'exports' in c.directives_ and res and getattr(res[-1], 'has_sd', 0): res.insert(-1, c)
+            else: res.append(c)
+        self.nb.cells = res[::-1]
 
 # %% ../nbs/api/10_processors.ipynb
 _re_defaultexp = re.compile(r'^\s*#\|\s*default_exp\s+(\S+)', flags=re.MULTILINE)
@@ -120,19 +122,29 @@ def _default_exp(nb):
     return default_exp.group(1) if default_exp else None
 
 # %% ../nbs/api/10_processors.ipynb
-def add_links(cell):
-    "Add links to markdown cells"
-    nl = NbdevLookup()
+def _add_links(cell, nl):
     if cell.cell_type == 'markdown': cell.source = nl.linkify(cell.source)
     for o in cell.get('outputs', []):
         if hasattr(o, 'data') and hasattr(o['data'], 'text/markdown'):
             o.data['text/markdown'] = [nl.link_line(s) for s in o.data['text/markdown']]
 
+def add_links(cell):
+    "Add links to markdown cells and markdown outputs"
+    _add_links(cell, NbdevLookup())
+
+class add_nb_links(Processor):
+    "Add links to the markdown cells and markdown outputs of the whole notebook"
+    def begin(self):
+        # One lookup (and its cache of resolved spans) for the whole notebook
+        nl = NbdevLookup()
+        for cell in self.nb.cells: _add_links(cell, nl)
+
 # %% ../nbs/api/10_processors.ipynb
 def add_fold(cell):
     "Add `code-fold` to `exports` cells"
     if cell.cell_type != 'code' or 'exports' not in cell.directives_: return
     cell.source = f'#| code-fold: show\n#| code-summary: "Exported source"\n{cell.source}'
+add_fold.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 _re_ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
@@ -141,11 +153,13 @@ def strip_ansi(cell):
     "Strip Ansi Characters."
     for outp in cell.get('outputs', []):
         if outp.get('name')=='stdout': outp['text'] = [_re_ansi_escape.sub('', o) for o in outp.text]
+strip_ansi.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 def strip_hidden_metadata(cell):
     '''Strips "hidden" metadata property from code cells so it doesn't interfere with docs rendering'''
     if cell.cell_type == 'code' and 'metadata' in cell: cell.metadata.pop('hidden',None)
+strip_hidden_metadata.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 def hide_(cell):
@@ -160,6 +174,7 @@ def hide_line(cell):
     lang = cell_lang(cell)
     if cell.cell_type == 'code' and _re_hideline(lang).search(cell.source):
         cell.source = '\n'.join([c for c in cell.source.splitlines() if not _re_hideline(lang).search(c)])
+hide_line.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 def filter_stream_(cell, *words):
@@ -175,6 +190,7 @@ _magics_pattern = re.compile(r'^\s*(%%|%).*', re.MULTILINE)
 def clean_magics(cell):
     "A preprocessor to remove cell magic commands"
     if cell.cell_type == 'code': cell.source = _magics_pattern.sub('', cell.source).strip()
+clean_magics.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 _re_hdr_dash = re.compile(r'^#+\s+.*\s+-\s*$', re.MULTILINE)
@@ -184,6 +200,7 @@ def rm_header_dash(cell):
     if cell.source:
         src = cell.source.strip()
         if cell.cell_type == 'markdown' and src.startswith('#') and src.endswith(' -'): del(cell['source'])
+rm_header_dash.cell_types = {'markdown'}
 
 # %% ../nbs/api/10_processors.ipynb
 _hide_dirs = {'export','exporti', 'hide','default_exp'}
@@ -203,6 +220,7 @@ def clean_show_doc(cell):
     "Remove ShowDoc input cells"
     if not _is_showdoc(cell): return
     _add_directives(cell, {'output':'asis','echo':'false'})
+clean_show_doc.cell_types = {'code'}
 
 # %% ../nbs/api/10_processors.ipynb
 def _ast_contains(trees, types):
@@ -228,6 +246,7 @@ def _do_eval(cell):
 # %% ../nbs/api/10_processors.ipynb
 class exec_show_docs(Processor):
     "Execute cells needed for `show_docs` output, including exported cells and imports"
+    cell_types = {'code'}
     def begin(self):
         if nb_lang(self.nb) != 'python': return
         self.k = CaptureShell()
@@ -268,7 +287,7 @@ class FilterDefaults:
     def base_procs(self):
         return [FrontmatterProc, populate_language, add_show_docs, insert_warning,
                 strip_ansi, hide_line, filter_stream_, rm_header_dash,
-                clean_show_doc, exec_show_docs, rm_export, clean_magics, hide_, add_links, add_fold, mv_exports, strip_hidden_metadata]
+                clean_show_doc, exec_show_docs, rm_export, clean_magics, hide_, add_nb_links, add_fold, mv_exports, strip_hidden_metadata]
 
     def procs(self):
         "Processors for export"
@@ -14,7 +14,7 @@ from fastcore.parallel import parallel
 from fastcore.script import call_parse
 from fastcore.meta import delegates
 
-from .config import get_config
+from .config import get_config,profiler
 from .doclinks import nbglob_cli,nbglob
 from .processors import FilterDefaults
 import nbdev.serve_drv
@@ -77,5 +77,6 @@ def proc_nbs(
     files = files.map(_proc_file, mtime=cache_mtime, cache=cache, path=path).filter()
     kw = {} if IN_NOTEBOOK else {'method':'spawn'}
     parallel(nbdev.serve_drv.main, files, n_workers=n_workers, pause=0.01, **kw)
+    profiler.save()
     if cache.exists(): cache.touch()
     return cache
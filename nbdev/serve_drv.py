@@ -12,9 +12,12 @@ def exec_scr(src, dst, md):
     dst.write_text(res + f.getvalue())
 
 def exec_nb(src, dst, cb):
-    nb = read_nb(src)
-    cb()(nb)
-    write_nb(nb, dst)
+    from nbdev.config import profiler
+    with profiler.span(src.name, 'notebook'):
+        nb = read_nb(src)
+        cb()(nb)
+        write_nb(nb, dst)
+    profiler.flush()
 
 def main(o):
     src,dst,x = o
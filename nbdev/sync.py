@@ -22,6 +22,7 @@ import ast
 import importlib
 
 # %% ../nbs/api/06_sync.ipynb
+@functools.lru_cache(maxsize=None)
 def absolute_import(name, fname, level):
     "Unwarps a relative import in `name` according to `fname`"
     if not level: return name
@@ -44,7 +45,7 @@ _re_import = re.compile(r"from\s+\S+\s+import\s+\S")
 # %% ../nbs/api/06_sync.ipynb
 def _to_absolute(code, py_path, lib_dir):
     if not _re_import.search(code): return code
-    res = update_import(code, ast.parse(code).body, str(py_path.relative_to(lib_dir).parent), absolute_import)
+    res = update_import(code, parse_cache(code), str(py_path.relative_to(lib_dir).parent), absolute_import)
     return ''.join(res) if res else code
 
 # %% ../nbs/api/06_sync.ipynb